@@ -0,0 +1,79 @@
+"""Measure the JSON decode and encode cost of endpoint payloads.
+
+For every endpoint payload, compares the standard library against the codec
+in ``api.py`` (orjson when installed) on the JSON steps of the integration:
+decoding a payload, as the capture replay does, and re-encoding a changed
+payload for its size statistic. The comparison of an unchanged payload with
+the previous one, which every poll makes, is timed as well. Each payload
+decoded by the codec is checked against the standard library result first.
+
+Responses are decrypted and parsed by nr7101, which is not timed here.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_decode [--hosts 250] [--payloads FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import timeit
+
+from benchmarks.mock_router import default_payloads, load_payloads
+from custom_components.ha_zyxel import api
+
+
+def best_of(func, number: int, repeat: int = 5) -> float:
+    """Return the best time of one call of ``func`` in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    """Run the benchmark for every payload and print a table."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hosts", type=int, default=250)
+    parser.add_argument("--payloads", help="JSON file of recorded payloads")
+    parser.add_argument("--number", type=int, default=200)
+    options = parser.parse_args()
+
+    payloads = (
+        load_payloads(options.payloads)
+        if options.payloads
+        else default_payloads(options.hosts)
+    )
+
+    print(f"codec: {'orjson' if api.orjson is not None else 'stdlib'}")
+    print(
+        f"{'endpoint':<16} {'bytes':>7} {'loads us':>9} {'codec us':>9} "
+        f"{'dumps us':>9} {'codec us':>9} {'same us':>9}"
+    )
+    totals = [0.0] * 5
+    for endpoint, payload in payloads.items():
+        raw = json.dumps(payload).encode()
+        if api.decode_json(raw) != json.loads(raw):
+            raise SystemExit(f"{endpoint}: decoded payload differs from stdlib")
+        previous = copy.deepcopy(payload)
+
+        timings = (
+            best_of(lambda: json.loads(raw.decode()), options.number),
+            best_of(lambda: api.decode_json(raw), options.number),
+            best_of(
+                lambda: json.dumps(payload, separators=(",", ":")).encode(),
+                options.number,
+            ),
+            best_of(lambda: api.encode_json(payload), options.number),
+            best_of(lambda: payload == previous, options.number),
+        )
+        totals = [total + timing for total, timing in zip(totals, timings)]
+        print(
+            f"{endpoint:<16} {len(raw):>7} "
+            + " ".join(f"{timing:>9.1f}" for timing in timings)
+        )
+
+    print(f"{'total':<16} {'':>7} " + " ".join(f"{t:>9.1f}" for t in totals))
+    print("same: comparing an unchanged payload with the previous one")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""End-to-end poll benchmark against simulated routers over HTTP.
+
+Serves fleets of 1, 10 and 50 ``MockRouter`` instances on localhost with the
+web interface protocol of the router, and polls each through its own
+``ZyxelDataUpdateCoordinator`` with an nr7101 client from ``create_router``.
+The login handshake, the encrypted requests, the relogin after an expired
+session, the executor threads shared by the fleet and the refresh of the
+value table are all part of the measurement. After every refresh, the
+sensor entities of a router read the state of the values that changed, as
+their state writes would. Every endpoint is due on every round.
+
+Reports refreshes per second, refresh latency percentiles, the CPU time the
+event loop spends per refresh, failed refreshes, logins and the share of
+unchanged payloads. The routers are served from an event loop in a thread
+of their own, so their work is not counted as event loop time.
+
+Run from the repository root in a Home Assistant development environment
+with nr7101 installed:
+
+    python -m benchmarks.bench_poll [--rounds 20] [--latency 0.02]
+        [--error-rate 0.0] [--session-lifetime SECONDS] [--payloads FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from benchmarks.mock_router import MockRouter, default_payloads, load_payloads
+from benchmarks.router_server import serve_routers
+from custom_components.ha_zyxel.api import create_router
+from custom_components.ha_zyxel.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DOMAIN,
+)
+from custom_components.ha_zyxel.coordinator import ZyxelDataUpdateCoordinator
+from custom_components.ha_zyxel.sensor import GenericZyxelSensor, _is_value_scalar
+
+FLEET_SIZES = (1, 10, 50)
+
+
+class BenchEntry:
+    """A config entry of a served router, with its coordinator and sensors."""
+
+    def __init__(self, hass: HomeAssistant, index: int, router: MockRouter) -> None:
+        self.hass = hass
+        self.index = index
+        self.mock = router
+        self.entry: ConfigEntry | None = None
+        self.coordinator: ZyxelDataUpdateCoordinator | None = None
+        self.sensors: list[GenericZyxelSensor] = []
+
+    async def async_setup(self, url: str) -> None:
+        """Create the nr7101 client and coordinator, as entry setup does."""
+        data = {
+            CONF_HOST: url,
+            CONF_USERNAME: self.mock.username,
+            CONF_PASSWORD: self.mock.password,
+        }
+        self.entry = ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title=f"Zyxel device: ({url})",
+            data=data,
+            source="user",
+            options={},
+            entry_id=f"bench{self.index}",
+        )
+        router = await self.hass.async_add_executor_job(
+            create_router, url, self.mock.username, self.mock.password
+        )
+        self.coordinator = ZyxelDataUpdateCoordinator(self.hass, self.entry, router)
+
+    async def async_refresh(self) -> float | None:
+        """Refresh the coordinator and return its latency, or None if it failed."""
+        coordinator = self.coordinator
+        # Make every endpoint due, instead of waiting for its interval.
+        coordinator.scheduler._next_due.clear()
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        latency = time.perf_counter() - start
+        if not coordinator.last_update_success:
+            return None
+        if not self.sensors:
+            self._add_sensors()
+        self._read_states()
+        return latency
+
+    def _add_sensors(self) -> None:
+        """Create a sensor per scalar value, as the sensor platform does."""
+        values = self.coordinator.values
+        self.sensors = [
+            GenericZyxelSensor(self.coordinator, self.entry, key)
+            for key, value in values.items()
+            if _is_value_scalar(value)
+        ]
+        # Enabled entities keep the endpoints they read polled.
+        for key in values.roots():
+            self.coordinator.async_add_consumer(key)
+
+    def _read_states(self) -> None:
+        """Read the state of every sensor whose value changed."""
+        changed = self.coordinator.changed_keys
+        for sensor in self.sensors:
+            if changed is None or sensor._key in changed:
+                if sensor.available:
+                    sensor.state
+
+
+async def run_fleet(
+    hass: HomeAssistant, size: int, rounds: int, payloads: dict, options
+) -> dict:
+    """Poll ``size`` served routers ``rounds`` times and return measurements."""
+    entries = [
+        BenchEntry(
+            hass,
+            index,
+            MockRouter(
+                payloads,
+                latency=options.latency,
+                error_rate=options.error_rate,
+                session_lifetime=options.session_lifetime,
+                seed=index,
+            ),
+        )
+        for index in range(size)
+    ]
+    with serve_routers([entry.mock for entry in entries]) as servers:
+        for entry, server in zip(entries, servers):
+            await entry.async_setup(server.url)
+
+        # The first round logs in every router and creates the entities.
+        await asyncio.gather(*(entry.async_refresh() for entry in entries))
+        logins = sum(entry.mock.logins for entry in entries)
+
+        results: list[float | None] = []
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        for _ in range(rounds):
+            results.extend(
+                await asyncio.gather(*(entry.async_refresh() for entry in entries))
+            )
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+
+    latencies = [latency for latency in results if latency is not None]
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    endpoint_stats = [
+        stats
+        for entry in entries
+        for stats in entry.coordinator.stats.endpoints.values()
+    ]
+    return {
+        "routers": size,
+        "entities": sum(len(entry.sensors) for entry in entries),
+        "refreshes_per_s": len(results) / wall,
+        "p50_ms": quantiles[49] * 1000 if quantiles else float("nan"),
+        "p95_ms": quantiles[94] * 1000 if quantiles else float("nan"),
+        "p99_ms": quantiles[98] * 1000 if quantiles else float("nan"),
+        "loop_ms_per_refresh": cpu / max(len(results), 1) * 1000,
+        "failures": len(results) - len(latencies),
+        "relogins": sum(entry.mock.logins for entry in entries) - logins,
+        "unchanged": sum(stats.unchanged_payloads for stats in endpoint_stats)
+        / max(sum(stats.requests for stats in endpoint_stats), 1),
+    }
+
+
+def main() -> None:
+    """Run the benchmark for every fleet size and print a table."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--session-lifetime", type=float, default=None)
+    parser.add_argument("--hosts", type=int, default=40)
+    parser.add_argument("--payloads", help="JSON file of recorded payloads")
+    parser.add_argument("--workers", type=int, default=64)
+    options = parser.parse_args()
+    # Failed refreshes are counted in the table instead of logged.
+    logging.getLogger("custom_components.ha_zyxel").setLevel(logging.CRITICAL)
+
+    payloads = (
+        load_payloads(options.payloads)
+        if options.payloads
+        else default_payloads(options.hosts)
+    )
+
+    header = (
+        f"{'routers':>7} {'entities':>8} {'refresh/s':>9} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'loop ms':>7} {'fails':>5} "
+        f"{'relogin':>7} {'same':>5}"
+    )
+    print(header)
+
+    async def run(config_dir: str) -> None:
+        # Home Assistant runs executor jobs on a large shared pool.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=options.workers)
+        )
+        for size in FLEET_SIZES:
+            # A new instance per fleet, so that no state is shared between them.
+            hass = HomeAssistant(config_dir)
+            r = await run_fleet(hass, size, options.rounds, payloads, options)
+            print(
+                f"{r['routers']:>7} {r['entities']:>8} "
+                f"{r['refreshes_per_s']:>9.1f} {r['p50_ms']:>8.1f} "
+                f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                f"{r['loop_ms_per_refresh']:>7.2f} {r['failures']:>5} "
+                f"{r['relogins']:>7} {r['unchanged']:>5.0%}"
+            )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        asyncio.run(run(config_dir))
+
+
+if __name__ == "__main__":
+    main()
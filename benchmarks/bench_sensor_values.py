@@ -0,0 +1,111 @@
+"""Measure the per-refresh cost of reading sensor values.
+
+Compares the shared value table used by the sensor platform against the
+previous approach, where every ``available`` and ``state`` read split the
+entity key and walked the coordinator data from the root. The cost of
+writing a refresh into the table, paid once per refresh by the coordinator,
+is reported separately.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_sensor_values [--hosts 120] [--rounds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from custom_components.ha_zyxel.sensor import GenericZyxelSensor, _is_value_scalar
+from custom_components.ha_zyxel.value_table import ValueTable
+
+
+def build_snapshot(hosts: int) -> dict:
+    """Return a snapshot shaped like a busy router's data."""
+    return {
+        "cellular": {f"INTF_FIELD_{i}": i for i in range(60)},
+        "traffic": {
+            name: {"BytesSent": 1, "BytesReceived": 2, "PacketsSent": 3}
+            for name in ("WAN", "LAN", "USB")
+        },
+        "lanhosts": {
+            "hosts": {
+                str(i): {
+                    "HostName": f"host-{i}",
+                    "IPAddress": f"192.168.1.{i % 254}",
+                    "PhysAddress": f"00:00:00:00:{i // 256:02x}:{i % 256:02x}",
+                    "Active": True,
+                }
+                for i in range(hosts)
+            }
+        },
+        "device": {"DeviceInfo": {f"field_{i}": str(i) for i in range(20)}},
+    }
+
+
+class LegacySensor(GenericZyxelSensor):
+    """Sensor that resolves its value the way it did before the value table."""
+
+    @property
+    def available(self) -> bool:
+        try:
+            self._get_value_from_path()
+            return True
+        except (KeyError, AttributeError):
+            return False
+
+    @property
+    def state(self):
+        try:
+            return self._get_value_from_path()
+        except (KeyError, AttributeError):
+            return None
+
+    def _get_value_from_path(self):
+        value = self.coordinator.data
+        for k in self._key.split("."):
+            value = value[k]
+        return value
+
+
+def main() -> None:
+    """Run the benchmark and print the per-refresh cost of both approaches."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hosts", type=int, default=120)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    data = build_snapshot(args.hosts)
+    coordinator = SimpleNamespace(
+        data=data, values=ValueTable(), last_update_success=True
+    )
+    for root, subtree in data.items():
+        coordinator.values.update(root, subtree)
+    entry = SimpleNamespace(entry_id="bench", data={"host": "http://bench"})
+    keys = [k for k, v in coordinator.values.items() if _is_value_scalar(v)]
+    legacy = [LegacySensor(coordinator, entry, key) for key in keys]
+    sensors = [GenericZyxelSensor(coordinator, entry, key) for key in keys]
+
+    def read_all(entities) -> None:
+        # Home Assistant reads availability and then the state on every write.
+        for entity in entities:
+            if entity.available:
+                entity.state
+
+    def update() -> None:
+        for root, subtree in data.items():
+            coordinator.values.update(root, subtree)
+
+    cases = (
+        ("path walk", lambda: read_all(legacy)),
+        ("value table", lambda: read_all(sensors)),
+        ("table update", update),
+    )
+    print(f"{len(sensors)} entities")
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=args.rounds, repeat=5)) / args.rounds
+        print(f"{label:>12}: {seconds * 1e6:8.1f} µs per refresh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Measure the memory kept and churned by the snapshot values of a fleet.
+
+Compares three ways of keeping the values of every router:
+
+- dict merge: every fetched endpoint flattened into a new dict of dotted
+  keys, diffed against the previous one and merged into a new value table,
+  next to the nested snapshot of the payloads.
+- table + tree: a ``ValueTable`` with its own schema per router, updated in
+  place, still next to the nested snapshot.
+- shared table: ``ValueTable`` instances sharing one schema, without any
+  nested snapshot, as the coordinators of routers on the same firmware
+  keep them.
+
+Routers are fed payloads from ``MockRouter`` with moving counters and signal
+values, so part of the values change on every poll, like on a live router.
+
+Reports the memory the fleet retains once the fetched payloads are dropped,
+including the payload objects each approach keeps referenced, the bytes
+allocated at peak while refreshing, the generation 0 garbage collections
+triggered and the CPU time per refresh. The last payload of each endpoint
+that the request statistics keep is the same in every approach and is not
+included.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_snapshot_memory [--routers 50] [--hosts 200]
+        [--rounds 20]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any
+
+from benchmarks.mock_router import MockRouter, default_payloads
+from custom_components.ha_zyxel.api import _ENDPOINTS, _parse_traffic_object
+from custom_components.ha_zyxel.coordinator import flatten_dict
+from custom_components.ha_zyxel.value_table import TableSchema, ValueTable
+
+
+def _changed_keys(old: dict[str, Any], new: dict[str, Any]) -> set[str]:
+    """Return the keys that were added, removed or changed between tables."""
+    changed = old.keys() ^ new.keys()
+    changed.update(
+        key for key, value in new.items() if key in old and old[key] != value
+    )
+    return changed
+
+
+class LegacyValues:
+    """Per-endpoint flattened dicts merged into a new table on every refresh."""
+
+    def __init__(self, schema: TableSchema) -> None:
+        self.values: dict[str, Any] = {}
+        self.flat_subtrees: dict[str, dict[str, Any]] = {}
+        self.snapshot: dict[str, Any] = {}
+
+    def refresh(self, data: dict[str, Any]) -> int:
+        changed: set[str] = set()
+        self.snapshot = {**self.snapshot, **data}
+        for key, subtree in data.items():
+            old = self.flat_subtrees.get(key, {})
+            new = self.flat_subtrees[key] = flatten_dict({key: subtree})
+            if new != old:
+                changed.update(_changed_keys(old, new))
+        values: dict[str, Any] = {}
+        for subtree in self.flat_subtrees.values():
+            values.update(subtree)
+        self.values = values
+        return len(changed)
+
+
+class TreeTableValues:
+    """A value table with its own schema, next to the nested snapshot."""
+
+    def __init__(self, schema: TableSchema) -> None:
+        self.values = ValueTable(TableSchema())
+        self.snapshot: dict[str, Any] = {}
+
+    def refresh(self, data: dict[str, Any]) -> int:
+        changed: set[str] = set()
+        self.snapshot = {**self.snapshot, **data}
+        for key, subtree in data.items():
+            changed.update(self.values.update(key, subtree))
+        return len(changed)
+
+
+class TableValues:
+    """Value tables sharing one schema, as routers on one firmware keep them."""
+
+    def __init__(self, schema: TableSchema) -> None:
+        self.values = ValueTable(schema)
+
+    def refresh(self, data: dict[str, Any]) -> int:
+        changed: set[str] = set()
+        for key, subtree in data.items():
+            changed.update(self.values.update(key, subtree))
+        return len(changed)
+
+
+def poll(router: MockRouter) -> dict[str, Any]:
+    """Return the data of one sweep of ``router``, keyed like the snapshot."""
+    data = {}
+    for endpoint, key in _ENDPOINTS:
+        payload = router.get_json_object(endpoint)
+        if endpoint == "Traffic_Status":
+            payload = _parse_traffic_object(payload)
+        data[key] = payload
+    return data
+
+
+def run(factory, routers: list[MockRouter], rounds: int) -> dict[str, float]:
+    """Refresh a table per router ``rounds`` times and return measurements."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    # A fleet shares one schema, created with it so that it is measured too.
+    schema = TableSchema()
+    tables = [factory(schema) for _ in routers]
+    for table, router in zip(tables, routers):
+        table.refresh(poll(router))
+
+    peak = 0
+    cpu = 0.0
+    collections = 0
+    changed = 0
+    for _ in range(rounds):
+        # Fetching the payloads is the same for both approaches.
+        sweeps = [poll(router) for router in routers]
+        before = gc.get_stats()[0]["collections"]
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        start = time.process_time()
+        for table, data in zip(tables, sweeps):
+            changed += table.refresh(data)
+        cpu += time.process_time() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+        collections += gc.get_stats()[0]["collections"] - before
+        del sweeps
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del tables
+    refreshes = rounds * len(routers)
+    return {
+        "retained_kib": retained / 1024,
+        "peak_kib": peak / 1024,
+        "gc0": collections,
+        "cpu_us": cpu / refreshes * 1e6,
+        "changed": changed / refreshes,
+    }
+
+
+def main() -> None:
+    """Run every approach on the same fleet and print a table."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--routers", type=int, default=50)
+    parser.add_argument("--hosts", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20)
+    options = parser.parse_args()
+
+    print(
+        f"{options.routers} routers, {options.hosts} LAN hosts each, "
+        f"{options.rounds} rounds"
+    )
+    print(
+        f"{'approach':<12} {'retained KiB':>12} {'peak KiB':>10} {'gc0':>5} "
+        f"{'cpu us':>8} {'changed':>8}"
+    )
+    for label, factory in (
+        ("dict merge", LegacyValues),
+        ("table + tree", TreeTableValues),
+        ("shared table", TableValues),
+    ):
+        routers = [
+            MockRouter(
+                default_payloads(options.hosts),
+                latency=0,
+                jitter=0,
+                login_latency=0,
+                seed=index,
+            )
+            for index in range(options.routers)
+        ]
+        result = run(factory, routers, options.rounds)
+        print(
+            f"{label:<12} {result['retained_kib']:>12.0f} {result['peak_kib']:>10.0f} "
+            f"{result['gc0']:>5} {result['cpu_us']:>8.1f} {result['changed']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""Simulated nr7101 router.
+
+``MockRouter`` simulates the router itself: payloads with moving counters,
+signal values and uptime, sessions, and injected latency, errors,
+unsupported endpoints and session expiry. ``router_server`` serves it over
+HTTP with the protocol of the router web interface, for a real nr7101
+client. It also implements the part of the nr7101 ``NR7101`` interface that
+``api.py`` relies on, ``login``, ``sessionkey``, ``get_json_object``, the
+cookies of ``session`` and ``reboot``, for benchmarks that only need its
+payloads in process.
+
+Payloads default to synthetic data shaped like an NR7101's and can be
+replaced with recorded ones.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import random
+import secrets
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+# Raised by nr7101 when the AES key no longer matches the router session.
+SESSION_ERROR = "Failed to process decrypted response"
+
+class CookieJar(dict):
+    """Cookie store that iterates like a ``requests`` cookie jar."""
+
+    def __iter__(self):
+        return iter(
+            [SimpleNamespace(name=name, value=value) for name, value in self.items()]
+        )
+
+
+def default_payloads(hosts: int = 40) -> dict[str, Any]:
+    """Return synthetic payloads for every endpoint in ``api._ENDPOINTS``."""
+    return {
+        "cellwan_status": {
+            "INTF_Status": "Up",
+            "INTF_Current_Access_Technology": "LTE",
+            "INTF_Current_Band": "B3",
+            "INTF_PhyCell_ID": 301,
+            "INTF_Cell_ID": 12345678,
+            "INTF_RSSI": -65,
+            "INTF_RSRP": -95,
+            "INTF_RSRQ": -11,
+            "INTF_SINR": 12,
+            "INTF_MCS": 20,
+            "INTF_CQI": 11,
+            "INTF_RI": 2,
+            "INTF_PMI": 0,
+            "NSA_Enable": True,
+            "NSA_PhyCellID": 88,
+            "NSA_Band": "n78",
+            "NSA_RSRP": -99,
+            "NSA_RSRQ": -12,
+            "NSA_RSSI": -70,
+            "NSA_SINR": 9,
+        },
+        "Traffic_Status": {
+            "ipIface": [
+                {"X_ZYXEL_IfName": name} for name in ("WWAN", "LAN", "ETH")
+            ],
+            "ipIfaceSt": [
+                {"BytesSent": 0, "BytesReceived": 0, "PacketsSent": 0}
+                for _ in range(3)
+            ],
+        },
+        "cardpage_status": {
+            "X_ZYXEL_TEMPERATURE_AMBIENT": 41,
+            "X_ZYXEL_TEMPERATURE_SDX": 55,
+            "X_ZYXEL_TEMPERATURE_CPU0": 60,
+            "WiFiInfo": {f"SSID{i}": f"network-{i}" for i in range(4)},
+        },
+        "lan": {
+            "IPAddress": "192.168.1.1",
+            "SubnetMask": "255.255.255.0",
+            "DHCPServerEnable": True,
+            "DNSServers": "192.168.1.1",
+        },
+        "lanhosts": {
+            "lanhosts": [
+                {
+                    "HostName": f"client-{i}",
+                    "IPAddress": f"192.168.1.{i + 10}",
+                    "PhysAddress": f"02:00:00:00:{i // 256:02x}:{i % 256:02x}",
+                    "Active": True,
+                    "X_ZYXEL_ConnectionType": "Wi-Fi" if i % 2 else "Ethernet",
+                }
+                for i in range(hosts)
+            ]
+        },
+        "wifi_easy_mesh": {
+            "Enable": True,
+            "Agents": {str(i): {"MAC": f"02:11:00:00:00:{i:02x}"} for i in range(2)},
+        },
+        "one_connect": {"Enable": False, "Topology": {}},
+        "status": {
+            "DeviceInfo": {
+                "ModelName": "NR7101",
+                "SoftwareVersion": "V1.00(ABUV.8)C0",
+                "SerialNumber": "S000000000000",
+                "UpTime": 0,
+            }
+        },
+    }
+
+
+def load_payloads(path: str | Path) -> dict[str, Any]:
+    """Load recorded payloads from a JSON file mapping endpoint to object."""
+    return json.loads(Path(path).read_text())
+
+
+class MockRouter:
+    """Simulated router, also usable as a blocking ``nr7101.NR7101``."""
+
+    def __init__(
+        self,
+        payloads: dict[str, Any] | None = None,
+        *,
+        latency: float = 0.02,
+        jitter: float = 0.01,
+        login_latency: float = 0.2,
+        error_rate: float = 0.0,
+        unsupported: tuple[str, ...] = (),
+        session_lifetime: float | None = None,
+        username: str = "admin",
+        password: str = "password",
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the router.
+
+        ``latency`` and ``jitter`` are in seconds per request. Requests fail
+        with probability ``error_rate``. Endpoints in ``unsupported`` always
+        fail, like on firmware that lacks them. After ``session_lifetime``
+        seconds the session expires and every request fails with the
+        decryption error nr7101 raises, until the next login.
+        """
+        self.payloads = payloads or default_payloads()
+        self.latency = latency
+        self.jitter = jitter
+        self.login_latency = login_latency
+        self.error_rate = error_rate
+        self.unsupported = unsupported
+        self.session_lifetime = session_lifetime
+        self.username = username
+        self.password = password
+
+        self.sessionkey: str | None = None
+        self.session = SimpleNamespace(cookies=CookieJar())
+        self.logins = 0
+        self.requests = 0
+        self.reboots = 0
+        self._session_started = 0.0
+        self._expired = False
+        self._booted = time.monotonic()
+        self._boot_requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, seconds: float) -> float:
+        """Return ``seconds`` with the jitter of one request added."""
+        with self._lock:
+            return seconds + self._random.uniform(0, self.jitter)
+
+    def start_session(self) -> str:
+        """Start a new session and return its key."""
+        with self._lock:
+            self.logins += 1
+            self._session_started = time.monotonic()
+            self._expired = False
+            return f"session-{self.logins}-{secrets.token_hex(8)}"
+
+    def session_expired(self, started: float) -> bool:
+        """Return whether the session started at ``started`` has expired."""
+        return self._expired or (
+            self.session_lifetime is not None
+            and time.monotonic() - started > self.session_lifetime
+        )
+
+    def read(self, oid: str) -> Any:
+        """Return the payload of an endpoint, or raise an injected failure."""
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+        if oid in self.unsupported or oid not in self.payloads:
+            raise KeyError(f"Endpoint {oid} is not supported")
+        if failed:
+            raise ConnectionError("Injected request failure")
+
+        payload = copy.deepcopy(self.payloads[oid])
+        self._advance(oid, payload)
+        return payload
+
+    def restart(self) -> None:
+        """Restart the router: drop the sessions and reset uptime and counters."""
+        with self._lock:
+            self.reboots += 1
+            self._expired = True
+            self._booted = time.monotonic()
+            self._boot_requests = self.requests
+
+    def login(self) -> bool:
+        """Start a new session."""
+        time.sleep(self.delay(self.login_latency))
+        self.sessionkey = self.start_session()
+        self.session.cookies.update({"Session": self.sessionkey})
+        return True
+
+    def expire_session(self) -> None:
+        """Invalidate the current session on the router side."""
+        self._expired = True
+
+    def get_json_object(self, oid: str) -> Any:
+        """Return the payload of an endpoint."""
+        time.sleep(self.delay(self.latency))
+        try:
+            payload = self.read(oid)
+        except KeyError as err:
+            raise Exception(err.args[0]) from None
+        if self.session_expired(self._session_started):
+            raise Exception(SESSION_ERROR)
+        return payload
+
+    def _advance(self, oid: str, payload: Any) -> None:
+        """Make counters, signal values and uptime move like on a live router."""
+        if oid == "Traffic_Status":
+            since_boot = self.requests - self._boot_requests
+            for status in payload.get("ipIfaceSt", []):
+                for counter in ("BytesSent", "BytesReceived"):
+                    if isinstance(status.get(counter), int):
+                        status[counter] += since_boot * 125_000
+        elif oid == "cellwan_status":
+            for field in ("INTF_RSSI", "INTF_RSRP", "INTF_SINR"):
+                if isinstance(payload.get(field), int):
+                    payload[field] += self._random.randint(-1, 1)
+        elif oid == "status":
+            info = payload.get("DeviceInfo")
+            if isinstance(info, dict) and isinstance(info.get("UpTime"), int):
+                info["UpTime"] += int(time.monotonic() - self._booted)
+
+    def reboot(self) -> None:
+        """Drop the session, as a reboot would."""
+        self.sessionkey = None
+        self.restart()
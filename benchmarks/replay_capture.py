@@ -0,0 +1,161 @@
+"""Replay a payload capture through the parsing and sensor code.
+
+Reads a capture recorded with the ``ha_zyxel.start_capture`` service,
+including its rotated files, and feeds it as fast as possible through the
+steps a refresh runs on live data: ``_parse_traffic_object``, the update of
+the value table, and the sensors of the sensor platform, created
+for every new scalar value like on the first refresh. Reports the time spent
+in each step; ``--profile`` prints a cProfile report instead.
+
+Consecutive records form one sweep until an endpoint repeats. An exception
+raised by a sweep is reported with the index of its first record, or raised
+with ``--strict``. ``--export`` writes the last payload of every endpoint in
+the ``--payloads`` format of the other benchmarks, to run them on real data.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.replay_capture CAPTURE [--repeat 1] [--profile]
+        [--strict] [--export FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import pstats
+import time
+import traceback
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.ha_zyxel.api import ENDPOINT_KEYS, _parse_traffic_object
+from custom_components.ha_zyxel.capture import read_capture
+from custom_components.ha_zyxel.sensor import GenericZyxelSensor, _is_value_scalar
+from custom_components.ha_zyxel.value_table import ValueTable
+
+
+def split_sweeps(records: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Group consecutive records into sweeps, starting one per repeated endpoint."""
+    sweeps: list[list[dict[str, Any]]] = []
+    seen: set[str] = set()
+    for record in records:
+        if not sweeps or record["endpoint"] in seen:
+            sweeps.append([])
+            seen = set()
+        sweeps[-1].append(record)
+        seen.add(record["endpoint"])
+    return sweeps
+
+
+class Replay:
+    """A router entry refreshed from captured sweeps."""
+
+    def __init__(self) -> None:
+        self.coordinator = SimpleNamespace(
+            data=None, values=ValueTable(), last_update_success=True
+        )
+        self.entry = SimpleNamespace(
+            entry_id="replay", data={"host": "http://replay"}, options={}
+        )
+        self.sensors: dict[str, GenericZyxelSensor] = {}
+        self.timings = {"parse": 0.0, "flatten": 0.0, "sensors": 0.0}
+        self.changed = 0
+
+    def refresh(self, sweep: list[dict[str, Any]]) -> None:
+        """Run one captured sweep through the refresh steps."""
+        start = time.perf_counter()
+        data = {}
+        for record in sweep:
+            payload = record["payload"]
+            if record["endpoint"] == "Traffic_Status":
+                payload = _parse_traffic_object(payload)
+            if payload:
+                data[ENDPOINT_KEYS[record["endpoint"]]] = payload
+        parsed = time.perf_counter()
+
+        values = self.coordinator.values
+        for key, payload in data.items():
+            self.changed += len(values.update(key, payload))
+        self.coordinator.data = values
+        flattened = time.perf_counter()
+
+        for key, value in values.items():
+            if key not in self.sensors and _is_value_scalar(value):
+                self.sensors[key] = GenericZyxelSensor(
+                    self.coordinator, self.entry, key
+                )
+        for sensor in self.sensors.values():
+            if sensor.available:
+                sensor.state
+        done = time.perf_counter()
+
+        self.timings["parse"] += parsed - start
+        self.timings["flatten"] += flattened - parsed
+        self.timings["sensors"] += done - flattened
+
+
+def main() -> None:
+    """Replay the capture and print the time spent in each step."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("capture", help="capture file, without rotation suffix")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--strict", action="store_true")
+    parser.add_argument("--export", help="write the last payloads to this file")
+    options = parser.parse_args()
+
+    records = list(read_capture(options.capture))
+    if not records:
+        raise SystemExit(f"{options.capture}: no records")
+    sweeps = split_sweeps(records)
+    print(
+        f"{len(records)} records in {len(sweeps)} sweeps, "
+        f"{records[-1]['time'] - records[0]['time']:.0f} s of capture"
+    )
+
+    replay = Replay()
+    errors = 0
+
+    def run() -> None:
+        nonlocal errors
+        index = 0
+        for sweep in sweeps:
+            try:
+                replay.refresh(sweep)
+            except Exception:
+                if options.strict:
+                    raise
+                errors += 1
+                print(f"sweep at record {index} failed:")
+                traceback.print_exc()
+            index += len(sweep)
+
+    profiler = cProfile.Profile() if options.profile else None
+    start = time.perf_counter()
+    for _ in range(options.repeat):
+        if profiler is not None:
+            profiler.runcall(run)
+        else:
+            run()
+    wall = time.perf_counter() - start
+
+    refreshes = len(sweeps) * options.repeat
+    print(f"{'step':<10} {'total ms':>10} {'us/sweep':>10}")
+    for step, seconds in replay.timings.items():
+        print(f"{step:<10} {seconds * 1000:>10.1f} {seconds / refreshes * 1e6:>10.1f}")
+    print(
+        f"{refreshes / wall:.0f} sweeps/s, {len(replay.sensors)} sensors, "
+        f"{replay.changed} changed values, {errors} failed sweeps"
+    )
+
+    if profiler is not None:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+    if options.export:
+        payloads = {record["endpoint"]: record["payload"] for record in records}
+        with open(options.export, "w", encoding="utf-8") as export:
+            json.dump(payloads, export, indent=2)
+
+
+if __name__ == "__main__":
+    main()
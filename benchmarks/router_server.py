@@ -0,0 +1,247 @@
+"""HTTP server speaking the web interface protocol of a Zyxel router.
+
+``MockRouterServer`` serves a ``MockRouter`` on localhost so that a real
+nr7101 client created with ``api.create_router`` talks to it like to a
+router: the RSA public key, the encrypted login that sets the AES key and
+session cookie of the client, and AES encrypted DAL objects. A request with
+an expired or unknown session is answered with a key the client does not
+have, so that nr7101 fails to decrypt it as it does against a router.
+
+Requires aiohttp and pycryptodome, which Home Assistant and nr7101 install.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from aiohttp import web
+from Crypto.Cipher import AES, PKCS1_v1_5
+from Crypto.PublicKey import RSA
+from Crypto.Util.Padding import pad, unpad
+
+from benchmarks.mock_router import MockRouter
+
+# Result of a successful DAL request or login.
+RESULT_SUCCESS = "ZCFG_SUCCESS"
+
+# Seconds a rebooting router does not answer, by default.
+REBOOT_DOWNTIME = 5.0
+
+_RSA_KEY: RSA.RsaKey | None = None
+
+
+def _rsa_key() -> RSA.RsaKey:
+    """Return the RSA key of every served router, generated once."""
+    global _RSA_KEY
+    if _RSA_KEY is None:
+        _RSA_KEY = RSA.generate(2048)
+    return _RSA_KEY
+
+
+class MockRouterServer:
+    """HTTP server on localhost speaking the web interface protocol of a router.
+
+    Serves ``router`` on a free port of 127.0.0.1 within the running event
+    loop, from ``start`` until ``stop``. Every request waits for the latency
+    of the router without blocking the loop, so one loop serves many routers.
+    A POST or PUT to ``/cgi-bin/`` with a valid session restarts the router,
+    which then closes its port for ``reboot_downtime`` seconds.
+    """
+
+    def __init__(
+        self, router: MockRouter, *, reboot_downtime: float = REBOOT_DOWNTIME
+    ) -> None:
+        """Initialize the server of ``router``."""
+        self.router = router
+        self.reboot_downtime = reboot_downtime
+        # AES key and start time of every session, by session cookie.
+        self._sessions: dict[str, tuple[bytes, float]] = {}
+        self._down_until = 0.0
+        self._runner: web.AppRunner | None = None
+        self._site: web.TCPSite | None = None
+        self._port = 0
+        self._reboot_task: asyncio.Task | None = None
+        self.url = ""
+
+    async def start(self) -> str:
+        """Start serving and return the URL of the router."""
+        app = web.Application()
+        app.router.add_get("/", self._handle_page)
+        app.router.add_get("/getRSAPublickKey", self._handle_public_key)
+        app.router.add_post("/UserLogin", self._handle_login)
+        app.router.add_get("/cgi-bin/DAL", self._handle_dal)
+        app.router.add_route("POST", "/cgi-bin/{name:.*}", self._handle_write)
+        app.router.add_route("PUT", "/cgi-bin/{name:.*}", self._handle_write)
+        app.middlewares.append(self._middleware)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await self._open()
+        self._port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{self._port}"
+        return self.url
+
+    async def _open(self) -> None:
+        """Listen on the port of the router, a free one the first time."""
+        self._site = web.TCPSite(self._runner, "127.0.0.1", self._port)
+        await self._site.start()
+
+    async def _reboot(self) -> None:
+        """Close the port for the downtime of a reboot, then open it again."""
+        await asyncio.sleep(0.1)
+        await self._site.stop()
+        await asyncio.sleep(self._down_until - time.monotonic())
+        await self._open()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._reboot_task is not None:
+            self._reboot_task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.Response:
+        """Refuse requests on connections kept open while the router reboots."""
+        if time.monotonic() < self._down_until:
+            raise web.HTTPServiceUnavailable()
+        return await handler(request)
+
+    async def _handle_page(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text="<html><head><title>Zyxel NR7101</title></head></html>",
+            content_type="text/html",
+        )
+
+    async def _handle_public_key(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"RSAPublicKey": _rsa_key().publickey().export_key().decode()}
+        )
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        """Decrypt the login, check the credentials and start a session."""
+        await asyncio.sleep(self.router.delay(self.router.login_latency))
+        try:
+            body = json.loads(await request.text())
+            aes_key = PKCS1_v1_5.new(_rsa_key()).decrypt(
+                base64.b64decode(body["key"]), None
+            )
+            if aes_key is None:
+                raise ValueError("Invalid RSA ciphertext")
+            if len(aes_key) not in (16, 24, 32):
+                aes_key = base64.b64decode(aes_key)
+            login = json.loads(_decrypt(aes_key, body["iv"], body["content"]))
+        except (KeyError, TypeError, ValueError) as err:
+            raise web.HTTPBadRequest(text=f"Invalid login request: {err}") from err
+
+        password = base64.b64decode(login.get("Input_Passwd", "")).decode()
+        if (
+            login.get("Input_Account") != self.router.username
+            or password != self.router.password
+        ):
+            return self._encrypted(
+                aes_key, {"result": "Invalid Username or Password"}, status=401
+            )
+
+        sessionkey = self.router.start_session()
+        cookie = secrets.token_hex(16)
+        self._sessions = {cookie: (aes_key, time.monotonic())}
+        response = self._encrypted(
+            aes_key, {"result": RESULT_SUCCESS, "sessionkey": sessionkey}
+        )
+        response.set_cookie("Session", cookie)
+        return response
+
+    async def _handle_dal(self, request: web.Request) -> web.Response:
+        """Return the object of the requested OID, encrypted for the session."""
+        await asyncio.sleep(self.router.delay(self.router.latency))
+        session = self._session(request)
+        try:
+            payload = self.router.read(request.query.get("oid", ""))
+        except KeyError:
+            body = {"result": "ZCFG_INVALID_OBJECT", "Object": []}
+        except ConnectionError as err:
+            raise web.HTTPInternalServerError(text=str(err)) from err
+        else:
+            body = {"result": RESULT_SUCCESS, "Object": [payload]}
+        # Without a session the router answers with a key the client cannot
+        # know, which nr7101 reports as a decryption failure.
+        aes_key = secrets.token_bytes(32) if session is None else session
+        return self._encrypted(aes_key, body)
+
+    async def _handle_write(self, request: web.Request) -> web.Response:
+        """Restart the router, the only write request the integration makes."""
+        session = self._session(request)
+        if session is None:
+            raise web.HTTPUnauthorized()
+        response = self._encrypted(session, {"result": RESULT_SUCCESS})
+        self.router.restart()
+        self._sessions.clear()
+        self._down_until = time.monotonic() + self.reboot_downtime
+        self._reboot_task = asyncio.create_task(self._reboot())
+        return response
+
+    def _session(self, request: web.Request) -> bytes | None:
+        """Return the AES key of the session of ``request``, if still valid."""
+        session = self._sessions.get(request.cookies.get("Session", ""))
+        if session is None or self.router.session_expired(session[1]):
+            return None
+        return session[0]
+
+    @staticmethod
+    def _encrypted(
+        aes_key: bytes, body: dict[str, Any], status: int = 200
+    ) -> web.Response:
+        iv = secrets.token_bytes(16)
+        content = AES.new(aes_key, AES.MODE_CBC, iv).encrypt(
+            pad(json.dumps(body).encode(), AES.block_size)
+        )
+        return web.json_response(
+            {
+                "content": base64.b64encode(content).decode(),
+                "iv": base64.b64encode(iv).decode(),
+            },
+            status=status,
+        )
+
+
+def _decrypt(aes_key: bytes, iv: str, content: str) -> bytes:
+    """Decrypt the AES-CBC ``content`` of a request, both base64 encoded."""
+    cipher = AES.new(aes_key, AES.MODE_CBC, base64.b64decode(iv)[:16])
+    return unpad(cipher.decrypt(base64.b64decode(content)), AES.block_size)
+
+
+@contextmanager
+def serve_routers(
+    routers: list[MockRouter], **kwargs: Any
+) -> Iterator[list[MockRouterServer]]:
+    """Serve ``routers`` from an event loop in a thread of their own.
+
+    Keeps the work of the simulated routers out of the event loop of the
+    code under test. Keyword arguments are passed to every server.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    servers = [MockRouterServer(router, **kwargs) for router in routers]
+
+    def run(coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    try:
+        for server in servers:
+            run(server.start())
+        yield servers
+    finally:
+        for server in servers:
+            run(server.stop())
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
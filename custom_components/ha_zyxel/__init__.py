@@ -1,22 +1,31 @@
 """The Zyxel integration."""
 import asyncio
 import logging
-from datetime import timedelta
 
-import async_timeout
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from custom_components.ha_zyxel.api import create_router, fetch_status
+from custom_components.ha_zyxel.api import create_router
 from custom_components.ha_zyxel.const import (
     CONF_HOST,
     CONF_PASSWORD,
     CONF_USERNAME,
-    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from custom_components.ha_zyxel.coordinator import (
+    ZyxelDataUpdateCoordinator,
+    capability_store,
+    session_store,
+    snapshot_store,
+    usage_store,
+)
+from custom_components.ha_zyxel.fleet import async_get_fleet
+from custom_components.ha_zyxel.services import (
+    async_setup_services,
+    async_unload_services,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +33,7 @@ _LOGGER = logging.getLogger(__name__)
 nr7101_logger = logging.getLogger("nr7101.nr7101")
 nr7101_logger.setLevel(logging.WARNING)
 
-PLATFORMS = ["sensor", "button"]
+PLATFORMS = ["sensor", "button", "device_tracker"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -43,35 +52,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Could not connect to Zyxel router: %s", ex)
         raise ConfigEntryNotReady from ex
 
-    async def async_update_data():
-        """Fetch data from the router."""
-        try:
-            async with async_timeout.timeout(15):
-                def get_all_data():
-                    data = fetch_status(router)
-
-                    if not data:
-                        raise UpdateFailed("No data received from router")
-
-                    return data
-
-                return await hass.async_add_executor_job(get_all_data)
-        except asyncio.TimeoutError:
-            router.sessionkey = None
-            raise UpdateFailed("Router data fetch timed out")
-        except Exception as err:
-            router.sessionkey = None
-            raise UpdateFailed(f"Error communicating with router: {err}") from err
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=DOMAIN,
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
-    )
+    coordinator = ZyxelDataUpdateCoordinator(hass, entry, router)
+    entry.async_on_unload(coordinator.async_release_schema)
+    await coordinator.async_load_capabilities()
+    await coordinator.async_load_usage()
 
-    await coordinator.async_config_entry_first_refresh()
+    # With a snapshot from the previous run, entities are set up from it and
+    # the router is only contacted once they exist.
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
@@ -81,9 +71,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Routers of all entries are polled by one scheduler so that a large
+    # fleet does not poll in bursts. A restored snapshot is replaced with live
+    # data right away.
+    fleet = async_get_fleet(hass)
+    entry.async_on_unload(
+        fleet.async_register(
+            entry.entry_id,
+            coordinator,
+            delay=0 if restored else coordinator.scheduler.tick,
+        )
+    )
+
+    async_setup_services(hass)
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, coordinator.async_save_on_stop
+        )
+    )
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = all(
@@ -95,6 +111,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)["coordinator"]
+        await coordinator.async_stop_capture()
+        await coordinator.async_save()
+        if not hass.data[DOMAIN]:
+            async_unload_services(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete everything stored for a removed config entry."""
+    await session_store(hass, entry.entry_id).async_remove()
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await capability_store(hass, entry.entry_id).async_remove()
+    await usage_store(hass, entry.entry_id).async_remove()
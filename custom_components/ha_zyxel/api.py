@@ -1,12 +1,39 @@
-"""Synchronous helpers for communicating with Zyxel devices."""
+"""Helpers for communicating with Zyxel devices.
+
+nr7101 owns the login handshake, the AES session and the keep-alive HTTP
+session of each router. Its calls are blocking, so the async helpers below
+drive a sweep from the event loop and hand each request to the executor
+individually instead of holding a worker thread for the whole sweep. Every
+request still occupies an executor thread while it runs, so the threads the
+requests of all routers may hold at once are capped by executor slots shared
+by their workers.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import contextlib
+import functools
+import json
 import logging
-from typing import Any
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Collection
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 from nr7101 import nr7101
 
+try:
+    import orjson
+except ImportError:  # Home Assistant ships orjson; plain Python may not.
+    orjson = None
+
+if TYPE_CHECKING:
+    from .capture import PayloadCapture
+
 _LOGGER = logging.getLogger(__name__)
 
 _ENDPOINTS = (
@@ -20,6 +47,160 @@ _ENDPOINTS = (
     ("status", "device"),
 )
 
+# Maps each endpoint name to the key its data is stored under.
+ENDPOINT_KEYS: dict[str, str] = dict(_ENDPOINTS)
+
+# Endpoints are fetched concurrently, at most this many at a time, and each
+# request is abandoned after ENDPOINT_TIMEOUT seconds. A full sweep of eight
+# endpoints takes at most two rounds, within the coordinator's 15 second budget.
+MAX_CONCURRENT_REQUESTS = 4
+ENDPOINT_TIMEOUT = 6
+
+# Socket timeout, in seconds, of every HTTP request nr7101 makes. An abandoned
+# request therefore releases its executor thread shortly after the sweep gave
+# up on it, instead of whenever the router answers.
+REQUEST_TIMEOUT = 5
+
+# Router attributes that make up an authenticated nr7101 session, next to the
+# cookies of its HTTP session. Attributes missing on a router are skipped.
+_SESSION_ATTRIBUTES = ("sessionkey", "aes_key", "iv")
+
+# Raised by nr7101 when the AES key no longer matches the router session.
+_SESSION_ERROR = "Failed to process decrypted response"
+
+# Small endpoint used to check whether a restored session is still accepted.
+_SESSION_PROBE_ENDPOINT = "status"
+
+# Seconds to wait for the router to accept a TCP connection when probing it.
+PROBE_TIMEOUT = 2
+
+
+# Upper bounds, in milliseconds, of the request latency histogram buckets. A
+# last bucket counts the slower requests, including those that timed out.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def decode_json(data: bytes | str) -> Any:
+    """Parse a JSON document, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON, with orjson when available.
+
+    orjson writes bytes directly, saving the intermediate string and its
+    encoded copy. Values it does not support, such as integers beyond 64
+    bits, fall back to the standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class EndpointStats:
+    """Request statistics of a single router endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.requests = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.last_latency_ms: float | None = None
+        self.total_latency_ms = 0.0
+        # Size in bytes of the last changed payload, re-serialized as compact
+        # JSON. Unchanged payloads keep the size of the previous one.
+        self.payload_size: int | None = None
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        # The last payload and its parsed form. A payload equal to the
+        # previous one reuses the parsed object, which tells the coordinator
+        # that nothing under the endpoint changed.
+        self.payload: Any = None
+        self.parsed: Any = None
+        self.unchanged = False
+        self.unchanged_payloads = 0
+        self.changed_payloads = 0
+
+    def record(
+        self,
+        latency_ms: float,
+        *,
+        payload: Any = None,
+        failed: bool = False,
+        timed_out: bool = False,
+    ) -> None:
+        """Record the outcome of one request."""
+        self.requests += 1
+        self.failures += failed or timed_out
+        self.timeouts += timed_out
+        self.last_latency_ms = latency_ms
+        self.total_latency_ms += latency_ms
+        self.histogram[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.unchanged = False
+        if payload is None:
+            return
+
+        # Comparing with the previous payload is exact and stops at the first
+        # difference, unlike a checksum of the whole serialized payload.
+        if payload == self.payload:
+            self.unchanged = True
+            self.unchanged_payloads += 1
+        else:
+            self.payload = payload
+            self.payload_size = len(encode_json(payload))
+            self.changed_payloads += 1
+
+    @property
+    def average_latency_ms(self) -> float | None:
+        """Return the mean latency of all requests."""
+        if not self.requests:
+            return None
+        return self.total_latency_ms / self.requests
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as JSON-safe data."""
+        bounds = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "last_latency_ms": self.last_latency_ms,
+            "average_latency_ms": self.average_latency_ms,
+            "payload_size": self.payload_size,
+            "unchanged_payloads": self.unchanged_payloads,
+            "changed_payloads": self.changed_payloads,
+            "latency_histogram": dict(
+                zip([*bounds, f">{LATENCY_BUCKETS_MS[-1]}ms"], self.histogram)
+            ),
+        }
+
+
+class RouterStats:
+    """Request statistics of a router, per endpoint and for logins."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.endpoints = {endpoint: EndpointStats() for endpoint, _ in _ENDPOINTS}
+        self.logins = 0
+        self.reauths = 0
+        # Sweeps refused because requests of a previous one were still running.
+        self.busy = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as JSON-safe data."""
+        return {
+            "logins": self.logins,
+            "reauths": self.reauths,
+            "busy": self.busy,
+            "endpoints": {
+                endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()
+            },
+        }
+
 
 class ZyxelAuthenticationError(Exception):
     """Raised when the router rejects the supplied credentials."""
@@ -29,6 +210,14 @@ class ZyxelConnectionError(Exception):
     """Raised when no usable data can be fetched from the router."""
 
 
+class ZyxelSessionError(ZyxelConnectionError):
+    """Raised when the router no longer accepts the session."""
+
+
+class ZyxelBusyError(Exception):
+    """Raised when requests of the previous sweep are still running."""
+
+
 def create_router(host: str, username: str, password: str) -> Any:
     """Create a router with connection state isolated from other instances.
 
@@ -37,7 +226,30 @@ def create_router(host: str, username: str, password: str) -> Any:
     config-flow instance being reused by the config-entry instance, where
     they would be paired with a different AES key.
     """
-    return nr7101.NR7101(host, username, password, {})
+    router = nr7101.NR7101(host, username, password, {})
+    _apply_request_timeout(router)
+    return router
+
+
+def _apply_request_timeout(router: Any) -> None:
+    """Give every request of the router's HTTP session a socket timeout.
+
+    nr7101 does not pass a timeout to ``requests``, which then waits for the
+    router indefinitely.
+    """
+    session = getattr(router, "session", None)
+    request = getattr(session, "request", None)
+    if request is None or getattr(request, "zyxel_timeout", False):
+        return
+
+    @functools.wraps(request)
+    def request_with_timeout(method: str, url: str, **kwargs: Any) -> Any:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = REQUEST_TIMEOUT
+        return request(method, url, **kwargs)
+
+    request_with_timeout.zyxel_timeout = True
+    session.request = request_with_timeout
 
 
 def authenticate(router: Any) -> None:
@@ -46,11 +258,62 @@ def authenticate(router: Any) -> None:
         login_success = router.login()
     except Exception as err:
         raise ZyxelConnectionError("Unable to complete router login") from err
+    finally:
+        # nr7101 may start a new HTTP session when logging in.
+        _apply_request_timeout(router)
 
     if not login_success or not getattr(router, "sessionkey", None):
         raise ZyxelAuthenticationError("The router rejected the credentials")
 
 
+def export_session(router: Any) -> dict[str, Any] | None:
+    """Return the session state of a logged in router as JSON-safe data."""
+    cookies = getattr(router, "session", None)
+    cookies = getattr(cookies, "cookies", None)
+    if not getattr(router, "sessionkey", None) or cookies is None:
+        return None
+
+    attributes: dict[str, str] = {}
+    binary: dict[str, str] = {}
+    for name in _SESSION_ATTRIBUTES:
+        value = getattr(router, name, None)
+        if isinstance(value, bytes):
+            binary[name] = base64.b64encode(value).decode()
+        elif isinstance(value, str):
+            attributes[name] = value
+
+    return {
+        "attributes": attributes,
+        "binary": binary,
+        "cookies": {cookie.name: cookie.value for cookie in cookies},
+    }
+
+
+def restore_session(router: Any, state: dict[str, Any]) -> bool:
+    """Reuse a stored session, returning whether the router still accepts it.
+
+    The session is checked with a single request. When it is rejected, the
+    router is left logged out so that the next fetch performs a full login.
+    """
+    try:
+        for name, value in state["attributes"].items():
+            setattr(router, name, value)
+        for name, value in state["binary"].items():
+            setattr(router, name, base64.b64decode(value))
+        router.session.cookies.update(state["cookies"])
+        valid = bool(router.get_json_object(_SESSION_PROBE_ENDPOINT))
+    except Exception as err:  # A stale session fails in many different ways.
+        _LOGGER.debug("Stored Zyxel session could not be reused: %s", err)
+        valid = False
+
+    if not valid:
+        router.sessionkey = None
+        cookies = getattr(getattr(router, "session", None), "cookies", None)
+        if cookies is not None:
+            cookies.clear()
+    return valid
+
+
 def _parse_traffic_object(obj: dict[str, Any] | None) -> dict[str, Any]:
     """Convert Traffic_Status interface arrays to a keyed dictionary."""
     if not obj or "ipIface" not in obj or "ipIfaceSt" not in obj:
@@ -63,48 +326,276 @@ def _parse_traffic_object(obj: dict[str, Any] | None) -> dict[str, Any]:
     }
 
 
-def _fetch_available_endpoints(
-    router: Any,
-) -> tuple[dict[str, Any], Exception | None]:
-    """Fetch every supported endpoint once without an unbounded retry loop."""
+class RouterWorker:
+    """Run the blocking calls made to one router, one sweep at a time.
+
+    A request abandoned after ``ENDPOINT_TIMEOUT`` keeps its executor thread
+    until its socket timeout expires. Until every such call has returned,
+    the worker refuses to start another sweep, so that two sweeps never use
+    the router object and its session at the same time.
+
+    Each call takes one of the executor ``slots``, usually shared by the
+    workers of all routers, and keeps it until its thread returns, so that
+    abandoned requests count against the slots too. Without shared slots the
+    worker gets MAX_CONCURRENT_REQUESTS of its own.
+    """
+
+    def __init__(self, router: Any, slots: asyncio.Semaphore | None = None) -> None:
+        """Initialize the worker."""
+        self.router = router
+        self._slots = (
+            asyncio.Semaphore(MAX_CONCURRENT_REQUESTS) if slots is None else slots
+        )
+        self._lock = threading.Lock()
+        self._running_calls = 0
+        self._sweeping = False
+        self._session_stale = False
+        # Receives the raw payload of every request while a capture runs.
+        self.capture: PayloadCapture | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Return whether a sweep or one of its requests is still running."""
+        return self._sweeping or self._running_calls > 0
+
+    async def async_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a single blocking nr7101 call in the default executor."""
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+        # Set by whichever comes first: the call starting in its thread, which
+        # then releases the slot when it returns, or the caller giving up on
+        # a call that has not started, which releases it right away.
+        claimed = [False]
+
+        def claim() -> bool:
+            with self._lock:
+                first = not claimed[0]
+                claimed[0] = True
+            return first
+
+        def run() -> Any:
+            if not claim():
+                return None
+            with self._lock:
+                self._running_calls += 1
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running_calls -= 1
+                with contextlib.suppress(RuntimeError):  # The loop has closed.
+                    loop.call_soon_threadsafe(self._slots.release)
+
+        try:
+            return await loop.run_in_executor(None, run)
+        except asyncio.CancelledError:
+            if claim():
+                self._slots.release()
+            raise
+
+    def invalidate_session(self) -> None:
+        """Log in again on the next sweep, once no request uses the session."""
+        self._session_stale = True
+
+    async def async_fetch_status(
+        self,
+        endpoints: Collection[str] | None = None,
+        stats: RouterStats | None = None,
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Return available router data, reauthenticating once when necessary.
+
+        ``endpoints`` limits the sweep to the given endpoint names; by default
+        every entry of ``_ENDPOINTS`` is fetched. The second item of the result
+        lists the endpoints that did not answer within ``ENDPOINT_TIMEOUT``;
+        the data of every other endpoint is returned regardless. Request
+        statistics are recorded in ``stats`` when given.
+
+        Raises ZyxelBusyError while requests of the previous sweep still run,
+        and ZyxelSessionError when the router rejects even a new session.
+        """
+        if stats is None:
+            stats = RouterStats()
+        if self.busy:
+            stats.busy += 1
+            raise ZyxelBusyError("The router is still busy with the previous update")
+
+        self._sweeping = True
+        try:
+            if self._session_stale:
+                self._session_stale = False
+                self.router.sessionkey = None
+            return await _async_sweep(self, endpoints, stats)
+        finally:
+            self._sweeping = False
+
+
+async def async_probe(host: str) -> bool:
+    """Return whether the router accepts connections on its web port.
+
+    Only opens and closes a TCP connection, without a request or a login.
+    """
+    url = urlsplit(host if "://" in host else f"https://{host}")
+    port = url.port or (80 if url.scheme == "http" else 443)
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(url.hostname, port), PROBE_TIMEOUT
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+def _discard_task_result(task: asyncio.Task) -> None:
+    """Retrieve the outcome of an abandoned task so it is not logged."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def _async_fetch_endpoint(
+    worker: RouterWorker,
+    semaphore: asyncio.Semaphore,
+    endpoint: str,
+    stats: EndpointStats,
+) -> Any:
+    """Fetch and parse one endpoint, giving up after ``ENDPOINT_TIMEOUT`` seconds.
+
+    A payload equal to the previous one is not parsed again; the object
+    returned for it last time is returned instead.
+    """
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(
+                worker.async_call(worker.router.get_json_object, endpoint),
+                ENDPOINT_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            stats.record(ENDPOINT_TIMEOUT * 1000, timed_out=True)
+            raise
+        except Exception:
+            stats.record((time.perf_counter() - start) * 1000, failed=True)
+            raise
+        stats.record((time.perf_counter() - start) * 1000, payload=data)
+        if worker.capture is not None:
+            worker.capture.add(endpoint, data, time.time())
+        if stats.unchanged:
+            return stats.parsed
+
+        if endpoint == "Traffic_Status":
+            data = _parse_traffic_object(data)
+        stats.parsed = data
+        return data
+
+
+async def _async_fetch_available_endpoints(
+    worker: RouterWorker,
+    endpoints: Collection[str] | None,
+    stats: RouterStats,
+) -> tuple[dict[str, Any], Exception | None, list[str]]:
+    """Fetch the requested endpoints concurrently, once each.
+
+    Returns the data of every endpoint that answered in time, the last
+    error seen and the endpoints that timed out.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    tasks = {
+        asyncio.create_task(
+            _async_fetch_endpoint(
+                worker, semaphore, endpoint, stats.endpoints[endpoint]
+            )
+        ): (endpoint, key)
+        for endpoint, key in _ENDPOINTS
+        if endpoints is None or endpoint in endpoints
+    }
     result: dict[str, Any] = {}
     last_error: Exception | None = None
+    timed_out: list[str] = []
+    session_error: Exception | None = None
 
-    for endpoint, key in _ENDPOINTS:
-        try:
-            data = router.get_json_object(endpoint)
-            if endpoint == "Traffic_Status":
-                data = _parse_traffic_object(data)
-            if data:
-                result[key] = data
-        except Exception as err:  # Different firmware exposes different endpoints.
-            last_error = err
-            _LOGGER.debug("Zyxel endpoint %s is unavailable: %s", endpoint, err)
-
-            # Invalid UTF-8 after AES decryption means the cookie/session and
-            # AES key no longer match. Continuing would emit the same error for
-            # every endpoint, so reauthenticate immediately.
-            if "Failed to process decrypted response" in str(err):
-                break
-
-    return result, last_error
-
-
-def fetch_status(router: Any) -> dict[str, Any]:
-    """Return available router data, reauthenticating once when necessary."""
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                endpoint, key = tasks[task]
+                try:
+                    data = task.result()
+                except asyncio.TimeoutError as err:
+                    last_error = err
+                    timed_out.append(endpoint)
+                    _LOGGER.debug("Zyxel endpoint %s timed out", endpoint)
+                    continue
+                except Exception as err:
+                    # Different firmware exposes different endpoints.
+                    last_error = err
+                    _LOGGER.debug(
+                        "Zyxel endpoint %s is unavailable: %s", endpoint, err
+                    )
+
+                    # Invalid UTF-8 after AES decryption means the cookie/session
+                    # and AES key no longer match. Every other request would fail
+                    # the same way, so drop the sweep and reauthenticate.
+                    if _SESSION_ERROR in str(err):
+                        session_error = err
+                    continue
+
+                if data:
+                    result[key] = data
+
+            if session_error is not None:
+                return {}, session_error, []
+    finally:
+        for task in pending:
+            task.cancel()
+            # A request can fail while its cancellation is being delivered.
+            task.add_done_callback(_discard_task_result)
+
+    # Keep the snapshot in _ENDPOINTS order regardless of completion order.
+    ordered = {key: result[key] for _, key in _ENDPOINTS if key in result}
+    return ordered, last_error, timed_out
+
+
+async def _async_sweep(
+    worker: RouterWorker, endpoints: Collection[str] | None, stats: RouterStats
+) -> tuple[dict[str, Any], list[str]]:
+    """Fetch the requested endpoints, reauthenticating once when necessary."""
+    router = worker.router
     if not getattr(router, "sessionkey", None):
-        authenticate(router)
+        stats.logins += 1
+        await worker.async_call(authenticate, router)
 
     last_error: Exception | None = None
     for attempt in range(2):
-        result, last_error = _fetch_available_endpoints(router)
-        if result:
-            return result
+        result, last_error, timed_out = await _async_fetch_available_endpoints(
+            worker, endpoints, stats
+        )
+        # A slow router is not a broken session. Abandoned requests may also
+        # still be using the session, so it is not replaced underneath them;
+        # the worker stays busy until they return.
+        if result or timed_out:
+            if timed_out:
+                _LOGGER.warning(
+                    "Zyxel endpoints timed out and were skipped: %s",
+                    ", ".join(timed_out),
+                )
+            return result, timed_out
 
         if attempt == 0:
             router.sessionkey = None
-            authenticate(router)
+            stats.logins += 1
+            stats.reauths += 1
+            await worker.async_call(authenticate, router)
 
+    if last_error is not None and _SESSION_ERROR in str(last_error):
+        raise ZyxelSessionError(
+            "The router did not accept the new session"
+        ) from last_error
     raise ZyxelConnectionError(
         "The router returned no supported status data"
     ) from last_error
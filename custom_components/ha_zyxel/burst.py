@@ -0,0 +1,67 @@
+"""Burst sampling of the cellular signal for the Zyxel integration."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .const import BURST_SIGNALS
+
+
+class BurstSession:
+    """Aggregate high rate cellular samples into per-window statistics.
+
+    Samples are collected every ``interval`` seconds until ``end``. Every
+    ``window`` seconds their minimum, maximum, mean and standard deviation
+    are published and a new window starts.
+    """
+
+    def __init__(
+        self, now: float, duration: float, interval: float, window: float
+    ) -> None:
+        """Initialize the session."""
+        self.end = now + duration
+        self.interval = interval
+        self.window = window
+        self.next_publish = now + window
+        # Statistics of the last published window, by signal key.
+        self.summary: dict[str, dict[str, float | int]] = {}
+        self.published = 0
+        self._samples: dict[str, list[float]] = {}
+
+    def add(self, cellular: dict[str, Any] | None) -> None:
+        """Record the signal values of one cellwan_status sample."""
+        for key in BURST_SIGNALS:
+            try:
+                value = float((cellular or {})[key])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if math.isfinite(value):
+                self._samples.setdefault(key, []).append(value)
+
+    def publish(self, now: float) -> None:
+        """Summarize the current window and start the next one."""
+        summary = {}
+        for key, values in self._samples.items():
+            count = len(values)
+            mean = sum(values) / count
+            summary[key] = {
+                "min": min(values),
+                "max": max(values),
+                "mean": mean,
+                "stddev": math.sqrt(sum((v - mean) ** 2 for v in values) / count),
+                "samples": count,
+            }
+        self.summary = summary
+        self.published += 1
+        self._samples = {}
+        self.next_publish = now + self.window
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the session state as JSON-safe data."""
+        return {
+            "remaining": max(self.end - now, 0),
+            "interval": self.interval,
+            "window": self.window,
+            "published": self.published,
+            "summary": self.summary,
+        }
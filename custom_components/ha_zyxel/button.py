@@ -16,16 +16,17 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Zyxel buttons."""
-    router = hass.data[DOMAIN][entry.entry_id]["router"]
-    async_add_entities([ZyxelRebootButton(entry, router)])
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    async_add_entities([ZyxelRebootButton(entry, coordinator)])
 
 
 class ZyxelRebootButton(ButtonEntity):
     """Representation of a Zyxel reboot button."""
 
-    def __init__(self, entry: ConfigEntry, router) -> None:
+    def __init__(self, entry: ConfigEntry, coordinator) -> None:
         """Initialize the button."""
-        self._router = router
+        self._entry = entry
+        self._coordinator = coordinator
         self._attr_unique_id = f"{entry.entry_id}_reboot"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
@@ -38,9 +39,21 @@ class ZyxelRebootButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        if self._coordinator.rebooting:
+            _LOGGER.warning("Zyxel device is already rebooting")
+            return
+
         _LOGGER.info("Attempting to reboot Zyxel device")
         try:
-            await self.hass.async_add_executor_job(self._router.reboot)
+            await self._coordinator.async_reboot()
             _LOGGER.info("Zyxel device reboot command sent successfully")
         except Exception as err:
             _LOGGER.error("Failed to send reboot command: %s", err)
+            return
+
+        # Polling stays paused until the router is back.
+        self._entry.async_create_background_task(
+            self.hass,
+            self._coordinator.async_wait_for_reboot(),
+            f"{DOMAIN} {self._entry.entry_id} reboot",
+        )
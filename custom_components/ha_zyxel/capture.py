@@ -0,0 +1,108 @@
+"""Capture of raw endpoint payloads for offline profiling."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import gzip
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from .api import decode_json, encode_json
+from .const import CAPTURE_BACKUPS
+
+
+def capture_files(path: str | Path) -> list[Path]:
+    """Return the existing files of a capture, oldest first."""
+    path = Path(path)
+    files = [path.with_name(f"{path.name}.{i}") for i in range(CAPTURE_BACKUPS, 0, -1)]
+    files.append(path)
+    return [file for file in files if file.exists()]
+
+
+def read_capture(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a capture, including its rotated files, in order.
+
+    Every record has the wall clock ``time`` of the request, the
+    ``endpoint`` name and the raw ``payload``.
+    """
+    for file in capture_files(path):
+        with gzip.open(file, "rb") as capture:
+            try:
+                for line in capture:
+                    yield decode_json(line)
+            except EOFError:
+                # The last member of a file being written can be incomplete.
+                continue
+
+
+class PayloadCapture:
+    """Append endpoint payloads to a gzip file with a size cap.
+
+    Records are buffered by ``add`` on the event loop and written by
+    ``write`` in the executor, each batch as one gzip member so that the file
+    is only ever appended to. Once it reaches ``max_bytes`` the file is
+    rotated, keeping CAPTURE_BACKUPS older files.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int) -> None:
+        """Initialize the capture."""
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.records = 0
+        self.bytes_written = 0
+        self.rotations = 0
+        self._pending: list[bytes] = []
+        self._lock = threading.Lock()
+
+    @property
+    def has_pending(self) -> bool:
+        """Return whether records are waiting to be written."""
+        return bool(self._pending)
+
+    def add(self, endpoint: str, payload: Any, now: float) -> None:
+        """Buffer the payload returned by ``endpoint`` at ``now``."""
+        self._pending.append(
+            encode_json({"time": now, "endpoint": endpoint, "payload": payload})
+            + b"\n"
+        )
+        self.records += 1
+
+    def take(self) -> list[bytes]:
+        """Return the buffered records and start a new batch."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def write(self, lines: list[bytes]) -> None:
+        """Append ``lines`` to the capture file, rotating it when full."""
+        if not lines:
+            return
+        data = gzip.compress(b"".join(lines))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as capture:
+                capture.write(data)
+                size = capture.tell()
+            self.bytes_written += len(data)
+            if size >= self.max_bytes:
+                self._rotate()
+
+    def _rotate(self) -> None:
+        """Shift the rotated files by one and start an empty capture file."""
+        for i in range(CAPTURE_BACKUPS, 0, -1):
+            source = (
+                self.path.with_name(f"{self.path.name}.{i - 1}") if i > 1 else self.path
+            )
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{i}"))
+        self.rotations += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the capture state as JSON-safe data."""
+        return {
+            "path": str(self.path),
+            "max_bytes": self.max_bytes,
+            "records": self.records,
+            "bytes_written": self.bytes_written,
+            "rotations": self.rotations,
+        }
@@ -5,14 +5,43 @@ import voluptuous as vol
 
 from homeassistant import config_entries, core
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 
 from .api import (
     ZyxelAuthenticationError,
     ZyxelConnectionError,
+    authenticate,
     create_router,
-    fetch_status,
 )
-from .const import DEFAULT_HOST, DEFAULT_USERNAME, DOMAIN
+from .const import (
+    CONF_BILLING_DAY,
+    CONF_DEADBANDS,
+    CONF_EXCLUDE_PREFIX,
+    CONF_INCLUDE_PREFIX,
+    CONF_INTERVAL_PREFIX,
+    CONF_MAX_ENTITIES,
+    CONF_MAX_WRITE_INTERVAL,
+    CONF_MIN_WRITE_INTERVALS,
+    CONF_SUBNET,
+    DEFAULT_BILLING_DAY,
+    DEFAULT_HOST,
+    DEFAULT_MAX_ENTITIES,
+    DEFAULT_MAX_WRITE_INTERVAL,
+    DEFAULT_SUBNET,
+    DEFAULT_USERNAME,
+    DOMAIN,
+    MAX_BILLING_DAY,
+    MAX_ENDPOINT_INTERVAL,
+    MAX_MAX_WRITE_INTERVAL,
+    MIN_ENDPOINT_INTERVAL,
+    MIN_MAX_WRITE_INTERVAL,
+)
+from .coordinator import (
+    get_endpoint_intervals,
+    get_entity_patterns,
+    split_assignments,
+)
+from .discovery import async_discover
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,26 +58,60 @@ DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(hass: core.HomeAssistant, data):
-    """Validate that the user input allows us to connect."""
-
+def _login(host: str, username: str, password: str) -> None:
+    """Log in to the router at ``host`` to check the credentials."""
     try:
-        # Create router instance and test connection
-        router = await hass.async_add_executor_job(
-            create_router,
-            data[CONF_HOST],
-            data[CONF_USERNAME],
-            data[CONF_PASSWORD]
-        )
-
-        await hass.async_add_executor_job(fetch_status, router)
+        authenticate(create_router(host, username, password))
     except (ZyxelAuthenticationError, ZyxelConnectionError):
         raise
     except Exception as ex:
-        _LOGGER.error("Unable to connect to Zyxel device: %s", ex)
-        raise ZyxelConnectionError from ex
+        raise ZyxelConnectionError(f"Unable to connect to {host}") from ex
 
-    return {"title": f"Zyxel device: ({data[CONF_HOST]})"}
+
+async def validate_input(hass: core.HomeAssistant, data):
+    """Validate that the user input allows us to connect.
+
+    Only logs in, without fetching any data. The host is tried with both
+    https and http at once, but the scheme it was entered with is kept
+    whenever it logs in, and https before http otherwise. Another scheme is
+    only used when the preferred ones fail, so a router entered with https
+    is never saved with http while https works.
+    """
+    host = data[CONF_HOST]
+    address = host.partition("://")[2] or host
+    hosts = [host] + [
+        url
+        for url in (f"https://{address}", f"http://{address}")
+        if url != host
+    ]
+    tasks = {
+        hass.async_add_executor_job(
+            _login, url, data[CONF_USERNAME], data[CONF_PASSWORD]
+        ): url
+        for url in hosts
+    }
+
+    errors = []
+    try:
+        # Attempts run concurrently, but their results are taken in order of
+        # preference.
+        for task, url in tasks.items():
+            try:
+                await task
+            except (ZyxelAuthenticationError, ZyxelConnectionError) as err:
+                _LOGGER.debug("Login to %s failed: %s", url, err)
+                errors.append(err)
+                continue
+            return {"title": f"Zyxel device: ({url})", "host": url}
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    # A rejected login means the router was reached on one of the schemes.
+    for err in errors:
+        if isinstance(err, ZyxelAuthenticationError):
+            raise err
+    raise errors[-1]
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -57,45 +120,220 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for this handler."""
+        return OptionsFlow()
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: list[str] = []
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "discover"])
+
+    async def _async_validate(self, user_input):
+        """Validate the input, returning the created entry or the form errors."""
         errors = {}
-        success = False
+        host = user_input[CONF_HOST].strip()
 
+        # sanitize entry
+        if not host.startswith("http://") and not host.startswith("https://"):
+            host = f"https://{host}"
+        user_input[CONF_HOST] = host
+
+        try:
+            info = await validate_input(self.hass, user_input)
+        except ZyxelAuthenticationError:
+            errors["base"] = "invalid_auth"
+        except ZyxelConnectionError as err:
+            _LOGGER.error("Connection attempt failed: %s", err)
+            errors["base"] = "cannot_connect"
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error while connecting: %s", e)
+            errors["base"] = "unknown"
+        else:
+            user_input[CONF_HOST] = info["host"]
+            return self.async_create_entry(title=info["title"], data=user_input), {}
+
+        return None, errors
+
+    async def async_step_manual(self, user_input=None):
+        """Handle a router entered by the user."""
+        errors = {}
         if user_input is not None:
-            host = user_input[CONF_HOST]
+            result, errors = await self._async_validate(user_input)
+            if result is not None:
+                return result
 
-            # sanitize entry
-            if not host.startswith("http://") and not host.startswith("https://"):
-                host = f"https://{host}"
-                user_input[CONF_HOST] = host
+        return self.async_show_form(
+            step_id="manual", data_schema=DATA_SCHEMA, errors=errors
+        )
 
+    async def async_step_discover(self, user_input=None):
+        """Scan a subnet for Zyxel web interfaces."""
+        errors = {}
+        if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
-                success = True
-            except ZyxelAuthenticationError:
-                errors["base"] = "invalid_auth"
-            except ZyxelConnectionError as err:
-                _LOGGER.error("Connection attempt failed: %s", err)
-                errors["base"] = "cannot_connect"
-
-            if not success and "https" not in user_input["host"]:
-                _LOGGER.info("User specified http but it failed, trying https...")
-                user_input["host"] = user_input["host"].replace("http://", "https://")
-                try:
-                    info = await validate_input(self.hass, user_input)
-                    success = True
-                except ZyxelAuthenticationError:
-                    errors["base"] = "invalid_auth"
-                except ZyxelConnectionError:
-                    errors["base"] = "cannot_connect"
-                except Exception as e:  # pylint: disable=broad-except
-                    _LOGGER.exception("Second attempt failed: %s", e)
-                    errors["base"] = "unknown"
-
-        if success:
-            return self.async_create_entry(title=info["title"], data=user_input)
-        else:
-            return self.async_show_form(
-                step_id="user", data_schema=DATA_SCHEMA, errors=errors
-            )
+                found = await async_discover(self.hass, user_input[CONF_SUBNET])
+            except ValueError:
+                errors["base"] = "invalid_subnet"
+            else:
+                configured = {
+                    entry.data[CONF_HOST] for entry in self._async_current_entries()
+                }
+                self._discovered = [url for url in found if url not in configured]
+                if self._discovered:
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        schema = vol.Schema({vol.Required(CONF_SUBNET, default=DEFAULT_SUBNET): str})
+        return self.async_show_form(
+            step_id="discover", data_schema=schema, errors=errors
+        )
+
+    async def async_step_pick(self, user_input=None):
+        """Add one of the discovered routers."""
+        errors = {}
+        if user_input is not None:
+            result, errors = await self._async_validate(user_input)
+            if result is not None:
+                return result
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_HOST): vol.In(self._discovered),
+                vol.Required(CONF_USERNAME, default=DEFAULT_USERNAME): str,
+                vol.Required(CONF_PASSWORD): str,
+            }
+        )
+        return self.async_show_form(step_id="pick", data_schema=schema, errors=errors)
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle Zyxel options: polling, entity selection, write filters and usage."""
+
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._options: dict = {}
+
+    async def async_step_init(self, user_input=None):
+        """Manage the polling interval of each endpoint."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return await self.async_step_entities()
+
+        interval = vol.All(
+            vol.Coerce(int),
+            vol.Range(min=MIN_ENDPOINT_INTERVAL, max=MAX_ENDPOINT_INTERVAL),
+        )
+        intervals = get_endpoint_intervals(self.config_entry)
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    f"{CONF_INTERVAL_PREFIX}{endpoint}", default=seconds
+                ): interval
+                for endpoint, seconds in intervals.items()
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+    async def async_step_entities(self, user_input=None):
+        """Manage which sensors are created for each endpoint."""
+        patterns = get_entity_patterns(self.config_entry)
+        if user_input is not None:
+            # Cleared fields are left out of the input, but must not fall back
+            # to the default patterns.
+            for endpoint in patterns:
+                user_input.setdefault(f"{CONF_INCLUDE_PREFIX}{endpoint}", "")
+                user_input.setdefault(f"{CONF_EXCLUDE_PREFIX}{endpoint}", "")
+            self._options.update(user_input)
+            return await self.async_step_filters()
+
+        fields = {
+            vol.Required(
+                CONF_MAX_ENTITIES,
+                default=self.config_entry.options.get(
+                    CONF_MAX_ENTITIES, DEFAULT_MAX_ENTITIES
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        }
+        for endpoint, (include, exclude) in patterns.items():
+            include_key = f"{CONF_INCLUDE_PREFIX}{endpoint}"
+            exclude_key = f"{CONF_EXCLUDE_PREFIX}{endpoint}"
+            # Suggested rather than default values, so that a cleared field
+            # is stored empty instead of falling back to the current patterns.
+            fields[
+                vol.Optional(include_key, description={"suggested_value": include})
+            ] = str
+            fields[
+                vol.Optional(exclude_key, description={"suggested_value": exclude})
+            ] = str
+
+        return self.async_show_form(
+            step_id="entities", data_schema=vol.Schema(fields)
+        )
+
+    async def async_step_filters(self, user_input=None):
+        """Manage the deadband filters of noisy sensors."""
+        errors = {}
+        if user_input is not None:
+            # Cleared fields are left out of the input.
+            user_input.setdefault(CONF_DEADBANDS, "")
+            user_input.setdefault(CONF_MIN_WRITE_INTERVALS, "")
+            try:
+                split_assignments(user_input[CONF_DEADBANDS])
+                split_assignments(user_input[CONF_MIN_WRITE_INTERVALS])
+            except ValueError:
+                errors["base"] = "invalid_filter"
+            else:
+                self._options.update(user_input)
+                return await self.async_step_usage()
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_DEADBANDS,
+                    description={"suggested_value": options.get(CONF_DEADBANDS, "")},
+                ): str,
+                vol.Optional(
+                    CONF_MIN_WRITE_INTERVALS,
+                    description={
+                        "suggested_value": options.get(CONF_MIN_WRITE_INTERVALS, "")
+                    },
+                ): str,
+                vol.Required(
+                    CONF_MAX_WRITE_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_WRITE_INTERVAL, DEFAULT_MAX_WRITE_INTERVAL
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_MAX_WRITE_INTERVAL, max=MAX_MAX_WRITE_INTERVAL),
+                ),
+            }
+        )
+        return self.async_show_form(
+            step_id="filters", data_schema=schema, errors=errors
+        )
+
+    async def async_step_usage(self, user_input=None):
+        """Manage the billing cycle of the data usage sensors."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return self.async_create_entry(title="", data=self._options)
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_BILLING_DAY,
+                    default=self.config_entry.options.get(
+                        CONF_BILLING_DAY, DEFAULT_BILLING_DAY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_BILLING_DAY)),
+            }
+        )
+        return self.async_show_form(step_id="usage", data_schema=schema)
@@ -6,4 +6,122 @@ DEFAULT_SCAN_INTERVAL = 30
 
 CONF_HOST = "host"
 CONF_USERNAME = "username"
-CONF_PASSWORD = "password"
\ No newline at end of file
+CONF_PASSWORD = "password"
+CONF_SUBNET = "subnet"
+
+DEFAULT_SUBNET = "192.168.1.0/24"
+
+# Options are stored as "interval_<endpoint>" so each endpoint gets its own
+# field in the options flow.
+CONF_INTERVAL_PREFIX = "interval_"
+
+MIN_ENDPOINT_INTERVAL = 5
+MAX_ENDPOINT_INTERVAL = 3600
+
+# Radio and traffic data change constantly, LAN topology and device details
+# hardly ever do.
+DEFAULT_ENDPOINT_INTERVALS = {
+    "cellwan_status": 10,
+    "Traffic_Status": 10,
+    "cardpage_status": DEFAULT_SCAN_INTERVAL,
+    "status": DEFAULT_SCAN_INTERVAL,
+    "lanhosts": 120,
+    "lan": 300,
+    "wifi_easy_mesh": 300,
+    "one_connect": 300,
+}
+
+# Entity selection. Each endpoint has comma separated include and exclude
+# glob patterns, matched against the sensor key below the endpoint, e.g.
+# "INTF_*". Excluded keys get no entity, generic keys that are not included
+# are created disabled.
+CONF_INCLUDE_PREFIX = "include_"
+CONF_EXCLUDE_PREFIX = "exclude_"
+CONF_MAX_ENTITIES = "max_entities"
+
+DEFAULT_MAX_ENTITIES = 300
+
+DEFAULT_INCLUDE_PATTERNS = {
+    "cellwan_status": "INTF_*, NSA_*",
+    "status": "DeviceInfo.*",
+}
+DEFAULT_EXCLUDE_PATTERNS = {
+    "lanhosts": "*",
+    "wifi_easy_mesh": "*",
+}
+
+# Write filtering of noisy sensors. Both per-sensor options are comma
+# separated "pattern=number" pairs, matched like the entity patterns, that
+# override the defaults of the known sensors.
+CONF_DEADBANDS = "deadbands"
+CONF_MIN_WRITE_INTERVALS = "min_write_intervals"
+CONF_MAX_WRITE_INTERVAL = "max_write_interval"
+
+DEFAULT_MAX_WRITE_INTERVAL = 300
+MIN_MAX_WRITE_INTERVAL = 30
+MAX_MAX_WRITE_INTERVAL = 3600
+
+# Traffic_Status byte counters that get derived throughput and usage sensors.
+THROUGHPUT_COUNTERS = ("BytesReceived", "BytesSent")
+
+# Day of the month the billing cycle of the usage sensors starts on.
+CONF_BILLING_DAY = "billing_day"
+DEFAULT_BILLING_DAY = 1
+MAX_BILLING_DAY = 28
+
+# Burst sampling polls only cellwan_status at a high rate, for antenna
+# alignment, and publishes statistics of these signal values per window.
+SERVICE_START_BURST = "start_burst"
+SERVICE_STOP_BURST = "stop_burst"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+ATTR_INTERVAL = "interval"
+ATTR_WINDOW = "window"
+
+DEFAULT_BURST_DURATION = 300
+MAX_BURST_DURATION = 1800
+DEFAULT_BURST_INTERVAL = 1
+MAX_BURST_INTERVAL = 5
+DEFAULT_BURST_WINDOW = 10
+MAX_BURST_WINDOW = 60
+
+BURST_SIGNALS = (
+    "INTF_RSSI",
+    "INTF_RSRP",
+    "INTF_RSRQ",
+    "INTF_SINR",
+    "NSA_RSSI",
+    "NSA_RSRP",
+    "NSA_RSRQ",
+    "NSA_SINR",
+)
+
+# Events fired when these cellwan_status fields change, with the values of
+# the fields before and after the change.
+EVENT_CONNECTION_CHANGED = f"{DOMAIN}_connection_changed"
+EVENT_ACCESS_TECHNOLOGY_CHANGED = f"{DOMAIN}_access_technology_changed"
+EVENT_CELL_CHANGED = f"{DOMAIN}_cell_changed"
+EVENT_BAND_CHANGED = f"{DOMAIN}_band_changed"
+
+CELLULAR_TRANSITIONS = {
+    EVENT_CONNECTION_CHANGED: ("INTF_Status",),
+    EVENT_ACCESS_TECHNOLOGY_CHANGED: ("INTF_Current_Access_Technology", "NSA_Enable"),
+    EVENT_CELL_CHANGED: ("INTF_Cell_ID", "INTF_PhyCell_ID", "NSA_PhyCellID"),
+    EVENT_BAND_CHANGED: ("INTF_Current_Band", "NSA_Band"),
+}
+
+# Payload capture records the raw response of every endpoint request to a
+# gzip file, for offline profiling with benchmarks/replay_capture.py. The
+# file is rotated once it reaches the maximum size, keeping CAPTURE_BACKUPS
+# older files.
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+
+ATTR_MAX_SIZE = "max_size"
+
+DEFAULT_CAPTURE_SIZE = 10
+MAX_CAPTURE_SIZE = 100
+CAPTURE_BACKUPS = 2
+
+STORAGE_VERSION = 1
@@ -0,0 +1,870 @@
+"""Data update coordinator for the Zyxel integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import async_timeout
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    ENDPOINT_KEYS,
+    RouterStats,
+    RouterWorker,
+    ZyxelAuthenticationError,
+    ZyxelBusyError,
+    ZyxelSessionError,
+    async_probe,
+    authenticate,
+    export_session,
+    restore_session,
+)
+from .burst import BurstSession
+from .capture import PayloadCapture
+from .fleet import async_get_fleet
+from .throughput import CounterRate
+from .usage import UsageMeter
+from .value_table import SchemaRegistry, ValueTable
+from .const import (
+    CELLULAR_TRANSITIONS,
+    CONF_BILLING_DAY,
+    CONF_EXCLUDE_PREFIX,
+    CONF_HOST,
+    CONF_INCLUDE_PREFIX,
+    CONF_INTERVAL_PREFIX,
+    CONF_USERNAME,
+    DEFAULT_BILLING_DAY,
+    DEFAULT_ENDPOINT_INTERVALS,
+    DEFAULT_EXCLUDE_PATTERNS,
+    DEFAULT_INCLUDE_PATTERNS,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    STORAGE_VERSION,
+    THROUGHPUT_COUNTERS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait before writing a new router session to storage.
+SESSION_SAVE_DELAY = 10
+# Minimum seconds between two writes of the last good snapshot. The latest
+# snapshot is also written when Home Assistant stops or the entry unloads.
+SNAPSHOT_SAVE_INTERVAL = 300
+# Minimum seconds between two writes of the data usage totals. The latest
+# totals are also written when Home Assistant stops or the entry unloads.
+USAGE_SAVE_INTERVAL = 60
+# An endpoint is considered unsupported after this many empty or failed
+# answers in a row; timeouts do not count. A single failure right after a
+# start therefore does not hide a working endpoint. Unsupported endpoints
+# are only retried every CAPABILITY_RECHECK_INTERVAL seconds, or right away
+# once the firmware version changes.
+CAPABILITY_MISS_LIMIT = 3
+CAPABILITY_RECHECK_INTERVAL = 3600
+# Endpoints a platform discovers new entities from are polled this often
+# while no enabled entity reads them, so that new entities still show up.
+DISCOVERY_INTERVAL = 3600
+# After a reboot command, the router is probed with a delay growing from
+# REBOOT_PROBE_MIN to REBOOT_PROBE_MAX seconds. It is given REBOOT_DOWN_TIMEOUT
+# seconds to go down and REBOOT_TIMEOUT seconds to come back.
+REBOOT_PROBE_MIN = 2
+REBOOT_PROBE_MAX = 30
+REBOOT_DOWN_TIMEOUT = 60
+REBOOT_TIMEOUT = 600
+
+
+DATA_SCHEMAS = f"{DOMAIN}_schemas"
+
+
+@callback
+def async_get_schemas(hass: HomeAssistant) -> SchemaRegistry:
+    """Return the value table schemas shared by all config entries."""
+    if DATA_SCHEMAS not in hass.data:
+        hass.data[DATA_SCHEMAS] = SchemaRegistry()
+    return hass.data[DATA_SCHEMAS]
+
+
+def session_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the router session of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.session", private=True)
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the last good snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot", private=True)
+
+
+def capability_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the endpoint capability map of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities")
+
+
+def usage_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the data usage totals of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.usage")
+
+
+def _firmware_version(values: ValueTable) -> str | None:
+    """Return the software version reported by the status endpoint."""
+    return values.get("device.DeviceInfo.SoftwareVersion")
+
+
+def _boot_time(values: ValueTable, now: float) -> float | None:
+    """Return the boot time of the router from the uptime it reports."""
+    try:
+        uptime = float(values["device.DeviceInfo.UpTime"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return now - uptime if uptime >= 0 else None
+
+
+def flatten_dict(d: dict, parent_key: str = "") -> dict:
+    """Flatten a nested dictionary with dot notation for keys."""
+    items: dict[str, Any] = {}
+    _flatten_into(items, d, parent_key)
+    return items
+
+
+def _flatten_into(items: dict[str, Any], d: dict, parent_key: str) -> None:
+    """Add the leaves of ``d`` to ``items`` without intermediate copies."""
+    for k, v in d.items():
+        new_key = f"{parent_key}.{k}" if parent_key else k
+        if isinstance(v, dict):
+            _flatten_into(items, v, new_key)
+        else:
+            items[new_key] = v
+
+
+def cellular_transitions(
+    old: dict[str, Any], new: dict[str, Any]
+) -> list[tuple[str, dict[str, Any], dict[str, Any]]]:
+    """Return the event type and the before and after values of each transition."""
+    transitions = []
+    for event_type, fields in CELLULAR_TRANSITIONS.items():
+        before = {field: old.get(field) for field in fields}
+        after = {field: new.get(field) for field in fields}
+        if before != after:
+            transitions.append((event_type, before, after))
+    return transitions
+
+
+def get_endpoint_intervals(entry: ConfigEntry) -> dict[str, int]:
+    """Return the polling interval of every endpoint, including overrides."""
+    return {
+        endpoint: int(
+            entry.options.get(
+                f"{CONF_INTERVAL_PREFIX}{endpoint}",
+                DEFAULT_ENDPOINT_INTERVALS.get(endpoint, DEFAULT_SCAN_INTERVAL),
+            )
+        )
+        for endpoint in ENDPOINT_KEYS
+    }
+
+
+def get_entity_patterns(entry: ConfigEntry) -> dict[str, tuple[str, str]]:
+    """Return the raw include and exclude patterns of every endpoint."""
+    return {
+        endpoint: (
+            entry.options.get(
+                f"{CONF_INCLUDE_PREFIX}{endpoint}",
+                DEFAULT_INCLUDE_PATTERNS.get(endpoint, ""),
+            ),
+            entry.options.get(
+                f"{CONF_EXCLUDE_PREFIX}{endpoint}",
+                DEFAULT_EXCLUDE_PATTERNS.get(endpoint, ""),
+            ),
+        )
+        for endpoint in ENDPOINT_KEYS
+    }
+
+
+def split_patterns(patterns: str) -> tuple[str, ...]:
+    """Split a comma separated pattern option into its globs."""
+    return tuple(p.strip() for p in patterns.split(",") if p.strip())
+
+
+def split_assignments(option: str) -> tuple[tuple[str, float], ...]:
+    """Split a comma separated ``pattern=number`` option into its pairs.
+
+    Raises ValueError for an entry without a pattern or a valid number.
+    """
+    pairs = []
+    for item in split_patterns(option):
+        pattern, _, number = item.partition("=")
+        value = float(number)
+        if not pattern.strip() or not 0 <= value < float("inf"):
+            raise ValueError(f"Invalid entry: {item}")
+        pairs.append((pattern.strip(), value))
+    return tuple(pairs)
+
+
+def _lan_host_list(obj: Any) -> list[dict[str, Any]]:
+    """Return the host entries of a lanhosts payload."""
+    if isinstance(obj, dict):
+        obj = obj.get("lanhosts")
+    if not isinstance(obj, list):
+        return []
+    return [host for host in obj if isinstance(host, dict)]
+
+
+class LanHostIndex:
+    """LAN hosts of a router keyed by MAC address.
+
+    The router reorders its host list freely, so hosts are matched by MAC
+    rather than position and only real changes are reported.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.hosts: dict[str, dict[str, Any]] = {}
+
+    def update(self, hosts: list[dict[str, Any]]) -> set[str]:
+        """Apply a new host list and return the MACs that changed.
+
+        Hosts that appeared or disappeared count as changed.
+        """
+        current: dict[str, dict[str, Any]] = {}
+        for host in hosts:
+            mac = str(host.get("PhysAddress") or "").lower()
+            if mac:
+                current[mac] = host
+
+        changed = self.hosts.keys() ^ current.keys()
+        changed.update(
+            mac
+            for mac, host in current.items()
+            if mac in self.hosts and self.hosts[mac] != host
+        )
+        for mac in changed:
+            if mac in current:
+                self.hosts[mac] = current[mac]
+            else:
+                del self.hosts[mac]
+        return changed
+
+
+class EndpointScheduler:
+    """Track when each router endpoint is next due for polling."""
+
+    def __init__(self, intervals: dict[str, int]) -> None:
+        """Initialize the scheduler with per-endpoint intervals in seconds."""
+        self.intervals = intervals
+        self._next_due: dict[str, float] = {}
+        self.tick = min(intervals.values())
+
+    def due(self, now: float) -> list[str]:
+        """Return the endpoints that should be fetched on this tick.
+
+        Ticks drift slightly, so an endpoint that becomes due within half a
+        tick is fetched now rather than one full tick late.
+        """
+        deadline = now + self.tick / 2
+        return [
+            endpoint
+            for endpoint in self.intervals
+            if self._next_due.get(endpoint, 0) <= deadline
+        ]
+
+    def mark_polled(self, endpoints: list[str], now: float) -> None:
+        """Schedule the next poll of the given endpoints."""
+        for endpoint in endpoints:
+            self._next_due[endpoint] = now + self.intervals[endpoint]
+
+
+class ZyxelDataUpdateCoordinator(DataUpdateCoordinator):
+    """Poll each router endpoint on its own interval into one snapshot."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, router: Any) -> None:
+        """Initialize the coordinator."""
+        self.router = router
+        self._host = entry.data[CONF_HOST]
+        # Every call to the router goes through its worker, which never runs
+        # two sweeps at once. The executor threads its calls may hold are
+        # shared with the routers of all other entries.
+        self.worker = RouterWorker(router, async_get_fleet(hass).request_slots)
+        self.scheduler = EndpointScheduler(get_endpoint_intervals(entry))
+        # The router session is persisted so that a restart or reload can
+        # skip the slow login. It is only valid for the same host and user.
+        self._session_store = session_store(hass, entry.entry_id)
+        self._session_owner = {
+            CONF_HOST: entry.data[CONF_HOST],
+            CONF_USERNAME: entry.data[CONF_USERNAME],
+        }
+        self._stored_sessionkey: str | None = None
+        self._session_restored = False
+        # The last good snapshot lets entities be created and restored on the
+        # next start without waiting for the router.
+        self._snapshot_store = snapshot_store(hass, entry.entry_id)
+        self._next_snapshot_save = 0.0
+        # Endpoints that have returned data at least once on this router.
+        self._answered: set[str] = set()
+        # Unsupported endpoints with the wall clock time of their next check,
+        # persisted together with the firmware version they were probed on.
+        self._capability_store = capability_store(hass, entry.entry_id)
+        self.unsupported: dict[str, float] = {}
+        self._misses: dict[str, int] = {}
+        self._firmware: str | None = None
+        # Endpoints that did not answer in time during the last sweep.
+        self.timed_out_endpoints: list[str] = []
+        # Request statistics of every endpoint, for diagnostics.
+        self.stats = RouterStats()
+        # Flattened values of the current snapshot, shared by all entities.
+        # The table is updated in place with the endpoints fetched on a tick
+        # and is also the coordinator data; no nested copy of the payloads is
+        # kept next to it. Its schema is shared with the routers on the same
+        # firmware once that is known from a previous run, and released when
+        # the entry unloads.
+        self._schemas = async_get_schemas(hass)
+        self._schema_key = entry.entry_id
+        self.values = ValueTable(self._schemas.acquire(self._schema_key))
+        # Changed payload count of each endpoint key when it was last written
+        # to the table. An unchanged payload leaves it as it is.
+        self._written_payloads: dict[str, int] = {}
+        # Keys whose value changed in the last update, or None when every
+        # entity has to write its state (first refresh or failed update).
+        self.changed_keys: set[str] | None = None
+        # State writes skipped by entities because their value did not change,
+        # held back by a deadband filter, or forced by one after its maximum
+        # interval.
+        self.suppressed_writes = 0
+        self.filtered_writes = 0
+        self.forced_writes = 0
+        # Number of enabled entities reading each endpoint key. Endpoints
+        # nobody reads are not polled after the first refresh.
+        self._consumers: dict[str, int] = {}
+        # Monotonic time of the next discovery poll of each endpoint key that
+        # new entities are discovered from.
+        self._discovery: dict[str, float] = {}
+        # LAN hosts by MAC address and the MACs that changed in the last
+        # update, or None when every tracker has to write its state.
+        self.lan_hosts = LanHostIndex()
+        self.changed_hosts: set[str] | None = None
+        # Endpoint keys fetched in the last update.
+        self.fetched_keys: set[str] = set()
+        # Rate of every traffic byte counter, by sensor key.
+        self.throughput: dict[str, CounterRate] = {}
+        # Data usage of every traffic byte counter, by sensor key, persisted
+        # so that it survives restarts of the router and of Home Assistant.
+        self.usage: dict[str, UsageMeter] = {}
+        self._usage_store = usage_store(hass, entry.entry_id)
+        # Set by a reboot command, so that the next counter readings are
+        # taken as reset instead of wrapped.
+        self._counters_restarted = False
+        self._next_usage_save = 0.0
+        self._billing_day = entry.options.get(CONF_BILLING_DAY, DEFAULT_BILLING_DAY)
+        # Last cellwan_status payload checked for transitions.
+        self._last_cellular: dict[str, Any] | None = None
+        self._entry_id = entry.entry_id
+        # Active burst sampling session, if any.
+        self.burst: BurstSession | None = None
+        # Polling is paused while the router reboots. The downtime is measured
+        # from the reboot command until the router accepts a login again.
+        self.rebooting = False
+        self.reboot_downtime: float | None = None
+        self._reboot_started = 0.0
+        # File of the payload capture, started and stopped by a service.
+        self._capture_path = hass.config.path(
+            DOMAIN, f"capture_{entry.entry_id}.jsonl.gz"
+        )
+
+        # Polls are started by the fleet scheduler on the scheduler tick.
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=None)
+
+    async def async_restore_session(self) -> None:
+        """Reuse the router session stored by the previous run if still valid."""
+        stored = await self._session_store.async_load()
+        if not stored or stored.get("owner") != self._session_owner:
+            return
+
+        if await self.worker.async_call(
+            restore_session, self.router, stored["session"]
+        ):
+            _LOGGER.debug("Reusing stored Zyxel router session")
+            self._stored_sessionkey = self.router.sessionkey
+
+    async def async_load_capabilities(self) -> None:
+        """Load the endpoints found unsupported by previous runs."""
+        stored = await self._capability_store.async_load()
+        if stored:
+            self._firmware = stored["firmware"]
+            self.unsupported = stored["unsupported"]
+        if self._firmware and not self.values:
+            self._use_schema(f"firmware:{self._firmware}")
+
+    def _use_schema(self, key: str) -> None:
+        """Move the still empty value table to the schema of ``key``."""
+        schema = self._schemas.acquire(key)
+        self._schemas.release(self._schema_key)
+        self._schema_key = key
+        self.values = ValueTable(schema)
+
+    @callback
+    def async_release_schema(self) -> None:
+        """Release the schema of the value table, when the entry unloads."""
+        self._schemas.release(self._schema_key)
+
+    async def async_load_usage(self) -> None:
+        """Load the data usage totals of the previous runs."""
+        stored = await self._usage_store.async_load()
+        if stored:
+            self.usage = {
+                key: UsageMeter.from_dict(meter, self._billing_day)
+                for key, meter in stored.items()
+            }
+
+    def _usage_data(self) -> dict[str, Any]:
+        """Return the data usage totals to store."""
+        return {key: meter.as_dict() for key, meter in self.usage.items()}
+
+    @callback
+    def async_save_on_stop(self, _event: Event | None = None) -> None:
+        """Schedule writing the periodically saved data when Home Assistant stops.
+
+        Saves requested while Home Assistant stops are written by Store at
+        its final write, with the data as it is then.
+        """
+        self._usage_store.async_delay_save(self._usage_data)
+        if self.values:
+            self._snapshot_store.async_delay_save(self.values.as_tree)
+
+    async def async_save(self) -> None:
+        """Write the periodically saved data, when the entry unloads."""
+        await self._usage_store.async_save(self._usage_data())
+        if self.values:
+            await self._snapshot_store.async_save(self.values.as_tree())
+
+    def _update_capabilities(self, endpoints: list[str], data: dict[str, Any]) -> None:
+        """Track which of the fetched endpoints the router supports."""
+        wall = time.time()
+        changed = False
+        for endpoint in endpoints:
+            if ENDPOINT_KEYS[endpoint] in data:
+                self._misses.pop(endpoint, None)
+                changed |= self.unsupported.pop(endpoint, None) is not None
+                continue
+
+            misses = self._misses[endpoint] = self._misses.get(endpoint, 0) + 1
+            if misses >= CAPABILITY_MISS_LIMIT:
+                _LOGGER.debug("Zyxel endpoint %s is unsupported", endpoint)
+                self.unsupported[endpoint] = wall + CAPABILITY_RECHECK_INTERVAL
+                changed = True
+
+        firmware = _firmware_version(self.values)
+        if firmware and firmware != self._firmware:
+            if self._firmware is not None:
+                _LOGGER.debug("Zyxel firmware changed, probing all endpoints")
+                self.unsupported.clear()
+            self._firmware = firmware
+            changed = True
+
+        if changed:
+            self._capability_store.async_delay_save(
+                lambda: {"firmware": self._firmware, "unsupported": self.unsupported},
+                SESSION_SAVE_DELAY,
+            )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last good snapshot as current data.
+
+        Returns False when there is no snapshot, in which case the first
+        refresh has to come from the router.
+        """
+        snapshot = await self._snapshot_store.async_load()
+        if not snapshot:
+            return False
+
+        for key, subtree in snapshot.items():
+            self.values.update(key, subtree)
+        self.lan_hosts.update(_lan_host_list(snapshot.get("lanhosts")))
+        self._last_cellular = snapshot.get("cellular")
+        self.data = self.values
+        return True
+
+    @callback
+    def _async_store_snapshot(self, now: float) -> None:
+        """Schedule saving the current snapshot, at most once per interval."""
+        if now < self._next_snapshot_save:
+            return
+        self._next_snapshot_save = now + SNAPSHOT_SAVE_INTERVAL
+        self._snapshot_store.async_delay_save(self.values.as_tree, 1)
+
+    @callback
+    def _async_store_session(self) -> None:
+        """Schedule saving the router session when it changed."""
+        sessionkey = getattr(self.router, "sessionkey", None)
+        if not sessionkey or sessionkey == self._stored_sessionkey:
+            return
+
+        session = export_session(self.router)
+        if session is None:
+            return
+        self._stored_sessionkey = sessionkey
+        self._session_store.async_delay_save(
+            lambda: {"owner": self._session_owner, "session": session},
+            SESSION_SAVE_DELAY,
+        )
+
+    def _select_endpoints(self, due: list[str]) -> list[str]:
+        """Return the due endpoints that can be fetched on this tick.
+
+        Unsupported endpoints are skipped until their next check. After the
+        first refresh, only endpoints read by an enabled entity are polled,
+        and endpoints new entities are discovered from every
+        DISCOVERY_INTERVAL seconds.
+
+        A sweep treats an empty answer as a broken session. An endpoint that
+        has never answered (most likely unsupported by the firmware) is
+        therefore only fetched together with one that has.
+        """
+        wall = time.time()
+        due = [ep for ep in due if self.unsupported.get(ep, 0) <= wall]
+        if self.data is not None:
+            due = [ep for ep in due if self._is_read(ENDPOINT_KEYS[ep])]
+
+        if not self._answered or any(ep in self._answered for ep in due):
+            return due
+        return []
+
+    def _is_read(self, key: str) -> bool:
+        """Return whether endpoint key ``key`` has to be polled now."""
+        if self._consumers.get(key):
+            return True
+        next_discovery = self._discovery.get(key)
+        if next_discovery is None or time.monotonic() < next_discovery:
+            return False
+        self._discovery[key] = time.monotonic() + DISCOVERY_INTERVAL
+        return True
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the seconds between two updates."""
+        if self.burst is not None:
+            return self.burst.interval
+        return self.scheduler.tick
+
+    @callback
+    def async_start_burst(
+        self, duration: float, interval: float, window: float
+    ) -> None:
+        """Poll only cellwan_status every ``interval`` seconds for a while."""
+        _LOGGER.info("Starting Zyxel burst sampling for %s seconds", duration)
+        self.burst = BurstSession(time.monotonic(), duration, interval, window)
+
+    @callback
+    def async_stop_burst(self) -> None:
+        """Resume normal polling."""
+        if self.burst is None:
+            return
+        _LOGGER.info("Zyxel burst sampling ended")
+        self.burst = None
+        self.async_update_listeners()
+
+    @property
+    def capture(self) -> PayloadCapture | None:
+        """Return the running payload capture, if any."""
+        return self.worker.capture
+
+    async def async_start_capture(self, max_bytes: int) -> None:
+        """Record the raw payload of every request until stopped."""
+        await self.async_stop_capture()
+        _LOGGER.info("Capturing Zyxel payloads to %s", self._capture_path)
+        self.worker.capture = PayloadCapture(self._capture_path, max_bytes)
+
+    async def async_stop_capture(self) -> None:
+        """Stop the payload capture and write its last records."""
+        capture = self.worker.capture
+        if capture is None:
+            return
+        self.worker.capture = None
+        await self._async_write_capture(capture)
+        _LOGGER.info(
+            "Captured %d Zyxel payloads to %s", capture.records, capture.path
+        )
+
+    async def _async_write_capture(self, capture: PayloadCapture) -> None:
+        """Append the payloads buffered by the capture to its file."""
+        if not capture.has_pending:
+            return
+        try:
+            await self.hass.async_add_executor_job(capture.write, capture.take())
+        except OSError as err:
+            _LOGGER.error("Stopping Zyxel payload capture: %s", err)
+            if self.worker.capture is capture:
+                self.worker.capture = None
+
+    async def async_reboot(self) -> None:
+        """Send the reboot command and pause polling until the router is back.
+
+        ``async_wait_for_reboot`` has to run afterwards to resume polling.
+        """
+        self.async_stop_burst()
+        self.rebooting = True
+        self._reboot_started = time.monotonic()
+        try:
+            await self.worker.async_call(self.router.reboot)
+        except Exception:
+            self.rebooting = False
+            raise
+        self._counters_restarted = True
+        self.async_update_listeners()
+
+    async def async_wait_for_reboot(self) -> None:
+        """Wait for the rebooting router to come back, then refresh."""
+        try:
+            await self._async_wait_for_reboot()
+        finally:
+            self.rebooting = False
+        await self.async_refresh()
+
+    async def _async_wait_for_reboot(self) -> None:
+        """Probe the router with a growing delay until it accepts a login."""
+        delay = REBOOT_PROBE_MIN
+        deadline = self._reboot_started + REBOOT_DOWN_TIMEOUT
+        while time.monotonic() < deadline and await async_probe(self._host):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, REBOOT_PROBE_MAX)
+
+        delay = REBOOT_PROBE_MIN
+        deadline = self._reboot_started + REBOOT_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, REBOOT_PROBE_MAX)
+            if not await async_probe(self._host):
+                continue
+
+            # The web server may answer before the login works. Keep probing
+            # until it does, but log in only once per successful probe.
+            self.stats.logins += 1
+            try:
+                await self.worker.async_call(authenticate, self.router)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Zyxel router not ready after reboot: %s", err)
+                continue
+
+            self.reboot_downtime = time.monotonic() - self._reboot_started
+            _LOGGER.info(
+                "Zyxel router back after %.0f seconds", self.reboot_downtime
+            )
+            self._async_store_session()
+            return
+
+        _LOGGER.warning(
+            "Zyxel router did not come back within %s seconds of a reboot",
+            REBOOT_TIMEOUT,
+        )
+
+    @callback
+    def async_add_consumer(self, key: str) -> CALLBACK_TYPE:
+        """Register an entity reading the data of endpoint ``key``."""
+        self._consumers[key] = self._consumers.get(key, 0) + 1
+
+        @callback
+        def remove_consumer() -> None:
+            self._consumers[key] -= 1
+
+        return remove_consumer
+
+    @callback
+    def async_add_discovery(self, key: str) -> CALLBACK_TYPE:
+        """Keep endpoint ``key`` polled for new entities, if slowly."""
+        self._discovery[key] = time.monotonic() + DISCOVERY_INTERVAL
+
+        @callback
+        def remove_discovery() -> None:
+            self._discovery.pop(key, None)
+
+        return remove_discovery
+
+    async def _async_update_data(self) -> ValueTable:
+        """Fetch the due endpoints and merge them into the last snapshot."""
+        # Availability of every entity flips when an update fails or the first
+        # one after a failure succeeds, so only diff between good updates.
+        diff = self.last_update_success and self.data is not None
+        self.changed_keys = None
+        self.changed_hosts = None
+        self.fetched_keys = set()
+
+        if not self._session_restored:
+            self._session_restored = True
+            await self.async_restore_session()
+
+        # The router is down or coming back; keep the last data until
+        # async_wait_for_reboot has logged in again.
+        if self.rebooting:
+            return self._keep_data(diff)
+
+        now = time.monotonic()
+        burst = self.burst
+        if burst is not None and now >= burst.end:
+            self.async_stop_burst()
+            burst = None
+
+        if burst is not None:
+            endpoints = ["cellwan_status"]
+        else:
+            endpoints = self._select_endpoints(self.scheduler.due(now))
+        if not endpoints:
+            return self._keep_data(diff)
+
+        try:
+            async with async_timeout.timeout(15):
+                data, timed_out = await self.worker.async_fetch_status(
+                    endpoints, self.stats
+                )
+        except ZyxelBusyError as err:
+            # Requests abandoned by the previous update are still running.
+            # Keep the current data; the due endpoints are fetched next tick.
+            if self.data is None:
+                raise UpdateFailed(str(err)) from err
+            _LOGGER.debug("Skipping Zyxel update: %s", err)
+            return self._keep_data(diff)
+        except asyncio.TimeoutError as err:
+            # A slow router keeps its session and the last data; the due
+            # endpoints count as timed out and are retried on the next tick.
+            if self.data is None:
+                raise UpdateFailed("Router data fetch timed out") from err
+            _LOGGER.debug("Zyxel update timed out, keeping the last data")
+            self.timed_out_endpoints = endpoints
+            return self._keep_data(diff)
+        except (ZyxelAuthenticationError, ZyxelSessionError) as err:
+            # Only a rejected login or session is worth a new login.
+            self.worker.invalidate_session()
+            raise UpdateFailed(f"Error communicating with router: {err}") from err
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with router: {err}") from err
+        finally:
+            if self.worker.capture is not None:
+                await self._async_write_capture(self.worker.capture)
+
+        self._async_store_session()
+
+        # Transitions are checked on every sample, burst ones included, so
+        # that automations react without waiting for the snapshot.
+        cellular = data.get("cellular")
+        if cellular is not None and cellular is not self._last_cellular:
+            self._fire_cellular_events(cellular)
+
+        # Burst samples are only merged into the snapshot once per window, so
+        # that the regular sensors are not written at the sampling rate.
+        if burst is not None:
+            burst.add(data.get("cellular"))
+            if now < burst.next_publish:
+                return self._keep_data(diff)
+            burst.publish(now)
+
+        # Timed out endpoints keep their previous data and are retried on the
+        # next tick instead of waiting for their full interval.
+        self.timed_out_endpoints = timed_out
+        endpoints = [ep for ep in endpoints if ep not in timed_out]
+        self.scheduler.mark_polled(endpoints, now)
+
+        changed: set[str] = set()
+        updated: set[str] = set()
+        for endpoint in endpoints:
+            key = ENDPOINT_KEYS[endpoint]
+            if key in data:
+                self._answered.add(endpoint)
+                # A payload unchanged since it was last written leaves its
+                # values and entities alone.
+                version = self.stats.endpoints[endpoint].changed_payloads
+                if self._written_payloads.get(key) == version:
+                    continue
+                self._written_payloads[key] = version
+                changed.update(self.values.update(key, data[key]))
+            else:
+                self._written_payloads.pop(key, None)
+                changed.update(self.values.remove(key))
+            updated.add(key)
+
+        if not self.values:
+            raise UpdateFailed("No data received from router")
+
+        self._update_capabilities(endpoints, data)
+
+        self.fetched_keys = {ENDPOINT_KEYS[ep] for ep in endpoints}
+        if "traffic" in self.fetched_keys:
+            self._update_throughput(now)
+
+        changed_hosts: set[str] = set()
+        if "lanhosts" in updated:
+            changed_hosts = self.lan_hosts.update(
+                _lan_host_list(data.get("lanhosts"))
+            )
+
+        if diff:
+            self.changed_keys = changed
+            self.changed_hosts = changed_hosts
+
+        self._async_store_snapshot(now)
+
+        return self.values
+
+    def _fire_cellular_events(self, cellular: dict[str, Any]) -> None:
+        """Fire an event for every transition since the last cellular sample."""
+        previous = self._last_cellular
+        self._last_cellular = cellular
+        if previous is None:
+            return
+        for event_type, before, after in cellular_transitions(previous, cellular):
+            _LOGGER.debug("Zyxel %s: %s -> %s", event_type, before, after)
+            self.hass.bus.async_fire(
+                event_type,
+                {
+                    "config_entry_id": self._entry_id,
+                    "host": self._host,
+                    "before": before,
+                    "after": after,
+                },
+            )
+
+    def _keep_data(self, diff: bool) -> ValueTable:
+        """Return the current data without any entity having to write."""
+        if diff:
+            self.changed_keys = set()
+            self.changed_hosts = set()
+        return self.data
+
+    def _update_throughput(self, now: float) -> None:
+        """Feed the traffic byte counters into their rate and usage trackers.
+
+        A drop of a counter can only be taken as a wrap with the uptime read
+        in the same update, which shows whether the router restarted.
+        """
+        local_now = dt_util.now()
+        boot = None
+        if "device" in self.fetched_keys:
+            boot = _boot_time(self.values, local_now.timestamp())
+        restarted, self._counters_restarted = self._counters_restarted, False
+        for key, raw in self.values.subtree_items("traffic"):
+            if key.rpartition(".")[2] not in THROUGHPUT_COUNTERS:
+                continue
+            try:
+                value = int(raw)
+            except (TypeError, ValueError):
+                continue
+            self.throughput.setdefault(key, CounterRate()).add(
+                value, now, boot, restarted=restarted
+            )
+            if key not in self.usage:
+                self.usage[key] = UsageMeter(self._billing_day)
+            self.usage[key].add(value, local_now, boot, restarted=restarted)
+
+        # Saving again before the pending save was written would postpone it,
+        # so no save is requested until then. It stores the totals as they are
+        # when it is written.
+        if now >= self._next_usage_save:
+            self._next_usage_save = now + USAGE_SAVE_INTERVAL
+            self._usage_store.async_delay_save(self._usage_data, USAGE_SAVE_INTERVAL)
+
+    def has_changed(self, key: str) -> bool:
+        """Return whether the entity reading ``key`` has to write its state."""
+        return self.changed_keys is None or key in self.changed_keys
+
+    def host_changed(self, mac: str) -> bool:
+        """Return whether the tracker of ``mac`` has to write its state."""
+        return self.changed_hosts is None or mac in self.changed_hosts
@@ -0,0 +1,74 @@
+"""Deadband filtering of noisy sensor values for the Zyxel integration."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+_UNSET = object()
+
+# Reasons returned by DeadbandFilter.check for writing a value.
+WRITE_INITIAL = "initial"
+WRITE_CHANGED = "changed"
+WRITE_MAX_INTERVAL = "max_interval"
+
+
+def _number(value: Any) -> float | None:
+    """Return ``value`` as a finite float, or None if it is not numeric."""
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+class DeadbandFilter:
+    """Decide when a sensor writes a new state.
+
+    A numeric value is written once it differs from the last written one by
+    more than ``deadband`` and at least ``min_interval`` seconds have passed.
+    A value held back by either rule is still written after ``max_interval``
+    seconds. Values that are not numeric are written whenever they change.
+    """
+
+    def __init__(
+        self, deadband: float, min_interval: float, max_interval: float
+    ) -> None:
+        """Initialize the filter."""
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.value: Any = _UNSET
+        self._written_at = 0.0
+
+    @property
+    def has_value(self) -> bool:
+        """Return whether a value was written."""
+        return self.value is not _UNSET
+
+    def check(self, value: Any, now: float) -> str | None:
+        """Return why ``value`` has to be written, or None to hold it."""
+        if self.value is _UNSET:
+            return WRITE_INITIAL
+        if value == self.value:
+            return None
+
+        elapsed = now - self._written_at
+        new, old = _number(value), _number(self.value)
+        if new is None or old is None:
+            return WRITE_CHANGED
+        if abs(new - old) > self.deadband and elapsed >= self.min_interval:
+            return WRITE_CHANGED
+        if elapsed >= self.max_interval:
+            return WRITE_MAX_INTERVAL
+        return None
+
+    def record(self, value: Any, now: float) -> None:
+        """Remember ``value`` as written."""
+        self.value = value
+        self._written_at = now
+
+    def reset(self) -> None:
+        """Write the next value regardless of the last one."""
+        self.value = _UNSET
@@ -0,0 +1,93 @@
+"""Support for tracking LAN hosts connected to a Zyxel device."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.device_tracker import ScannerEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up a tracker for every LAN host the router has seen."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    tracked: set[str] = set()
+
+    @callback
+    def async_add_new_hosts() -> None:
+        """Create trackers for hosts that appeared since the last update."""
+        new_macs = coordinator.lan_hosts.hosts.keys() - tracked
+        if not new_macs:
+            return
+        tracked.update(new_macs)
+        async_add_entities(
+            ZyxelLanHostTracker(coordinator, entry, mac) for mac in new_macs
+        )
+
+    # Trackers are disabled by default. The host list is polled on its
+    # interval while one is enabled, and only slowly for new hosts otherwise.
+    entry.async_on_unload(coordinator.async_add_discovery("lanhosts"))
+    entry.async_on_unload(coordinator.async_add_listener(async_add_new_hosts))
+    async_add_new_hosts()
+
+
+class ZyxelLanHostTracker(CoordinatorEntity, ScannerEntity):
+    """A LAN host identified by its MAC address."""
+
+    def __init__(self, coordinator, entry: ConfigEntry, mac: str) -> None:
+        """Initialize the tracker."""
+        super().__init__(coordinator)
+        self._mac = mac
+        self._attr_unique_id = f"{entry.entry_id}_{mac}"
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the host list polled while this tracker is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_consumer("lanhosts"))
+
+    @property
+    def _host(self) -> dict[str, Any]:
+        """Return the current router entry of this host."""
+        return self.coordinator.lan_hosts.hosts.get(self._mac, {})
+
+    @property
+    def name(self) -> str:
+        """Return the host name reported by the router, or the MAC."""
+        return self._host.get("HostName") or self._mac
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the host is currently connected."""
+        return bool(self._host.get("Active"))
+
+    @property
+    def ip_address(self) -> str | None:
+        """Return the IP address of the host."""
+        return self._host.get("IPAddress") or None
+
+    @property
+    def mac_address(self) -> str:
+        """Return the MAC address of the host."""
+        return self._mac
+
+    @property
+    def hostname(self) -> str | None:
+        """Return the host name of the host."""
+        return self._host.get("HostName") or None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the router entry of this host changed."""
+        if self.coordinator.host_changed(self._mac):
+            self.async_write_ha_state()
+        else:
+            self.coordinator.suppressed_writes += 1
@@ -0,0 +1,55 @@
+"""Diagnostics support for the Zyxel integration."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .fleet import async_get_fleet
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    fleet = async_get_fleet(hass)
+    member = fleet.members.get(entry.entry_id)
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "polling": {
+            "intervals": coordinator.scheduler.intervals,
+            "timed_out_endpoints": coordinator.timed_out_endpoints,
+            "unsupported_endpoints": coordinator.unsupported,
+            "last_update_success": coordinator.last_update_success,
+            "suppressed_writes": coordinator.suppressed_writes,
+            "rebooting": coordinator.rebooting,
+            "reboot_downtime": coordinator.reboot_downtime,
+            "filtered_writes": coordinator.filtered_writes,
+            "forced_writes": coordinator.forced_writes,
+            "fleet_polls": member.polls if member else None,
+            "fleet_last_lag": member.last_lag if member else None,
+        },
+        "fleet": fleet.as_dict(),
+        "burst": (
+            coordinator.burst.as_dict(time.monotonic())
+            if coordinator.burst is not None
+            else None
+        ),
+        "capture": (
+            coordinator.capture.as_dict() if coordinator.capture is not None else None
+        ),
+        "usage": {key: meter.as_dict() for key, meter in coordinator.usage.items()},
+        "requests": coordinator.stats.as_dict(),
+        "snapshot_keys": sorted(coordinator.values.roots()),
+    }
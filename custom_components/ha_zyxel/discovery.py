@@ -0,0 +1,66 @@
+"""Discovery of Zyxel web interfaces on a subnet."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import async_probe
+
+_LOGGER = logging.getLogger(__name__)
+
+# Addresses checked at the same time, and the largest subnet that is scanned.
+DISCOVERY_CONCURRENCY = 64
+MAX_DISCOVERY_ADDRESSES = 1024
+# Seconds to wait for the login page of an address with an open web port.
+DISCOVERY_TIMEOUT = 3
+
+
+async def _async_is_zyxel(session: aiohttp.ClientSession, url: str) -> bool:
+    """Return whether the web page at ``url`` is a Zyxel web interface."""
+    try:
+        async with session.get(
+            url, timeout=aiohttp.ClientTimeout(total=DISCOVERY_TIMEOUT)
+        ) as response:
+            page = await response.text(errors="ignore")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+    return "zyxel" in page.lower()
+
+
+async def async_discover(hass: HomeAssistant, subnet: str) -> list[str]:
+    """Return the URLs of the Zyxel web interfaces found in ``subnet``.
+
+    Every address is first probed with a TCP connection on the HTTPS and HTTP
+    ports, and only open ones are asked for their web page. Raises ValueError
+    for an invalid subnet or one larger than MAX_DISCOVERY_ADDRESSES.
+    """
+    network = ipaddress.ip_network(subnet.strip(), strict=False)
+    if network.num_addresses > MAX_DISCOVERY_ADDRESSES:
+        raise ValueError(f"Subnet {network} is too large to scan")
+
+    # Routers use self-signed certificates.
+    session = async_get_clientsession(hass, verify_ssl=False)
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def async_check(address: str) -> str | None:
+        async with semaphore:
+            for scheme in ("https", "http"):
+                url = f"{scheme}://{address}"
+                if await async_probe(url) and await _async_is_zyxel(session, url):
+                    return url
+        return None
+
+    results = await asyncio.gather(
+        *(
+            async_check(f"[{address}]" if address.version == 6 else str(address))
+            for address in network.hosts()
+        )
+    )
+    found = [url for url in results if url is not None]
+    _LOGGER.debug("Found %d Zyxel devices in %s", len(found), network)
+    return found
@@ -0,0 +1,200 @@
+"""Shared poll scheduler for all Zyxel routers.
+
+Every config entry registers its coordinator here instead of running its own
+timer. The scheduler polls at most FLEET_MAX_CONCURRENT_POLLS routers at once,
+starts the most overdue ones first and spreads routers with the same interval
+apart with random jitter, so that a large fleet does not poll in bursts.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+# Routers polled at the same time, across all config entries.
+FLEET_MAX_CONCURRENT_POLLS = 4
+# Executor threads the requests of all routers may hold at once, including
+# requests abandoned after their timeout until their socket gives up. Home
+# Assistant's default executor has 64 threads shared with everything else;
+# this leaves room for FLEET_MAX_CONCURRENT_POLLS routers fetching their
+# endpoints MAX_CONCURRENT_REQUESTS (api.py) at a time.
+FLEET_MAX_EXECUTOR_REQUESTS = 16
+# Seconds between two checks for due routers.
+FLEET_TICK = 1
+# Each poll is scheduled up to this fraction of the poll interval early or late.
+FLEET_JITTER = 0.1
+# The first poll of a router is delayed by up to this many seconds.
+FLEET_STARTUP_STAGGER = 5
+
+
+class FleetMember:
+    """Scheduling state of one registered router."""
+
+    def __init__(self, coordinator: Any, next_due: float) -> None:
+        """Initialize the member."""
+        self.coordinator = coordinator
+        self.next_due = next_due
+        self.task: asyncio.Task | None = None
+        self.polls = 0
+        self.last_lag: float | None = None
+
+
+class FleetStats:
+    """Poll statistics of the whole fleet."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.polls = 0
+        self.failures = 0
+        # Seconds between the time a poll was due and the time it started.
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        # Due routers that had to wait for a free slot, at the last tick and
+        # at worst.
+        self.waiting = 0
+        self.max_waiting = 0
+
+    def record(self, lag: float, *, failed: bool) -> None:
+        """Record the outcome of one poll."""
+        self.polls += 1
+        self.failures += failed
+        self.total_lag += lag
+        self.max_lag = max(self.max_lag, lag)
+
+    @property
+    def average_lag(self) -> float | None:
+        """Return the mean poll lag in seconds."""
+        if not self.polls:
+            return None
+        return self.total_lag / self.polls
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as JSON-safe data."""
+        return {
+            "polls": self.polls,
+            "failures": self.failures,
+            "average_lag": self.average_lag,
+            "max_lag": self.max_lag,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+        }
+
+
+class FleetScheduler:
+    """Poll the coordinators of all config entries with bounded concurrency."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.members: dict[str, FleetMember] = {}
+        self.stats = FleetStats()
+        # Executor slots shared by the workers of all routers.
+        self.request_slots = asyncio.Semaphore(FLEET_MAX_EXECUTOR_REQUESTS)
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @property
+    def polling(self) -> int:
+        """Return the number of routers being polled."""
+        return sum(member.task is not None for member in self.members.values())
+
+    @callback
+    def async_register(
+        self, entry_id: str, coordinator: Any, *, delay: float
+    ) -> CALLBACK_TYPE:
+        """Poll ``coordinator`` after ``delay`` seconds, then on its interval.
+
+        Returns a callback that removes the router from the fleet.
+        """
+        stagger = random.uniform(0, FLEET_STARTUP_STAGGER)
+        self.members[entry_id] = FleetMember(
+            coordinator, time.monotonic() + delay + stagger
+        )
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=FLEET_TICK)
+            )
+
+        @callback
+        def unregister() -> None:
+            member = self.members.pop(entry_id)
+            if member.task is not None:
+                member.task.cancel()
+            if not self.members and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return unregister
+
+    @callback
+    def async_poll_soon(self, entry_id: str) -> None:
+        """Poll a router on the next tick instead of on its schedule."""
+        if (member := self.members.get(entry_id)) is not None:
+            member.next_due = min(member.next_due, time.monotonic())
+
+    @callback
+    def _async_tick(self, _now: Any = None) -> None:
+        """Start the most overdue routers while there are free slots."""
+        now = time.monotonic()
+        due = sorted(
+            (member.next_due, entry_id)
+            for entry_id, member in self.members.items()
+            if member.task is None and member.next_due <= now
+        )
+        free = max(FLEET_MAX_CONCURRENT_POLLS - self.polling, 0)
+        self.stats.waiting = max(len(due) - free, 0)
+        self.stats.max_waiting = max(self.stats.max_waiting, self.stats.waiting)
+
+        for next_due, entry_id in due[:free]:
+            member = self.members[entry_id]
+            member.task = self.hass.async_create_background_task(
+                self._async_poll(member, now - next_due),
+                f"{DOMAIN} {entry_id} poll",
+            )
+
+    async def _async_poll(self, member: FleetMember, lag: float) -> None:
+        """Refresh one router and schedule its next poll."""
+        coordinator = member.coordinator
+        try:
+            await coordinator.async_refresh()
+        finally:
+            interval = coordinator.poll_interval
+            member.next_due = time.monotonic() + interval * random.uniform(
+                1 - FLEET_JITTER, 1 + FLEET_JITTER
+            )
+            member.task = None
+
+        member.polls += 1
+        member.last_lag = lag
+        self.stats.record(lag, failed=not coordinator.last_update_success)
+        if lag > coordinator.poll_interval:
+            _LOGGER.debug("Zyxel poll started %.1f seconds late", lag)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fleet state and statistics as JSON-safe data."""
+        return {
+            "routers": len(self.members),
+            "polling": self.polling,
+            "max_concurrent_polls": FLEET_MAX_CONCURRENT_POLLS,
+            "max_executor_requests": FLEET_MAX_EXECUTOR_REQUESTS,
+            **self.stats.as_dict(),
+        }
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> FleetScheduler:
+    """Return the fleet scheduler shared by all config entries."""
+    if DATA_FLEET not in hass.data:
+        hass.data[DATA_FLEET] = FleetScheduler(hass)
+    return hass.data[DATA_FLEET]
@@ -1,7 +1,10 @@
 """Support for Zyxel device sensors."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+import time
+from fnmatch import fnmatchcase
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -10,16 +13,57 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from custom_components.ha_zyxel.api import ENDPOINT_KEYS
+from custom_components.ha_zyxel.const import (
+    BURST_SIGNALS,
+    CONF_DEADBANDS,
+    CONF_MAX_ENTITIES,
+    CONF_MAX_WRITE_INTERVAL,
+    CONF_MIN_WRITE_INTERVALS,
+    DEFAULT_MAX_ENTITIES,
+    DEFAULT_MAX_WRITE_INTERVAL,
+    DOMAIN,
+    THROUGHPUT_COUNTERS,
+)
+from custom_components.ha_zyxel.coordinator import (
+    get_entity_patterns,
+    split_assignments,
+    split_patterns,
+)
+from custom_components.ha_zyxel.deadband import WRITE_MAX_INTERVAL, DeadbandFilter
+from custom_components.ha_zyxel.throughput import THROUGHPUT_WINDOWS
+from custom_components.ha_zyxel.usage import (
+    USAGE_CYCLE,
+    USAGE_DAY,
+    USAGE_MONTH,
+    USAGE_PERIODS,
+    period_start,
+)
+
 
-from custom_components.ha_zyxel.const import DOMAIN
+USAGE_PERIOD_NAMES = {
+    USAGE_DAY: "Today",
+    USAGE_MONTH: "This Month",
+    USAGE_CYCLE: "Billing Cycle",
+}
 
 _LOGGER = logging.getLogger(__name__)
 
-# Define some known sensor types for proper configuration
+# Define some known sensor types for proper configuration. The optional
+# "deadband" and "min_interval" keys are the default write filter of noisy
+# sensors, see DeadbandFilter.
 KNOWN_SENSORS = {
     "INTF_RSSI": {
         "name": "Cellular RSSI",
@@ -27,6 +71,7 @@ KNOWN_SENSORS = {
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
         "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "INTF_PhyCell_ID": {
         "name": "Physical Cell ID",
@@ -41,6 +86,7 @@ KNOWN_SENSORS = {
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
         "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "INTF_RSRQ": {
         "name": "Cellular Reference Signal Received Quality",
@@ -48,6 +94,7 @@ KNOWN_SENSORS = {
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
         "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "INTF_SINR": {
         "name": "Cellular Signal-to-Noise Ratio",
@@ -55,6 +102,7 @@ KNOWN_SENSORS = {
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
         "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "INTF_MCS": {
         "name": "Cellular Modulation and Coding Scheme",
@@ -62,6 +110,7 @@ KNOWN_SENSORS = {
         "icon": "mdi:signal",
         "device_class": None,
         "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "INTF_CQI": {
         "name": "Cellular Channel Quality Indicator",
@@ -69,6 +118,7 @@ KNOWN_SENSORS = {
         "icon": "mdi:signal",
         "device_class": None,
         "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "INTF_RI": {
         "name": "Cellular Rank Indicator",
@@ -96,49 +146,59 @@ KNOWN_SENSORS = {
         "unit": "dBm",
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "NSA_RSRQ": {
         "name": "NSA Reference Signal Received Quality",
         "unit": "dB",
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "NSA_RSSI": {
         "name": "NSA Reference Signal Strength Indicator",
         "unit": "dBm",
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "NSA_SINR": {
         "name": "NSA Signal-to-Noise Ratio",
         "unit": "dB",
         "icon": "mdi:signal",
         "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
     },
     "X_ZYXEL_TEMPERATURE_AMBIENT": {
         "name": "Ambient Temperature",
         "unit": "°C",
         "icon": "mdi:thermometer",
         "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
+        "min_interval": 60,
     },
     "X_ZYXEL_TEMPERATURE_SDX": {
         "name": "SDX Temperature",
         "unit": "°C",
         "icon": "mdi:thermometer",
         "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
+        "min_interval": 60,
     },
     "X_ZYXEL_TEMPERATURE_CPU0": {
         "name": "CPU Temperature",
         "unit": "°C",
         "icon": "mdi:thermometer",
         "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT
+        "state_class": SensorStateClass.MEASUREMENT,
+        "deadband": 1,
+        "min_interval": 60,
     },
     "BytesSent": {
         "name": "Bytes Sent",
@@ -157,23 +217,52 @@ KNOWN_SENSORS = {
 }
 
 
-def _flatten_dict(d: dict, parent_key: str = "") -> dict:
-    """Flatten a nested dictionary with dot notation for keys."""
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}.{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(_flatten_dict(v, new_key).items())
-        else:
-            items.append((new_key, v))
-    return dict(items)
-
-
 def _is_value_scalar(value: Any) -> bool:
     """Check if a value is a scalar (string, number, bool)."""
     return isinstance(value, (str, int, float, bool)) or value is None
 
 
+def _matches(key: str, patterns: tuple[str, ...]) -> bool:
+    """Check if a key matches any of the glob patterns."""
+    return any(fnmatchcase(key, pattern) for pattern in patterns)
+
+
+def _override(key: str, overrides: tuple[tuple[str, float], ...]) -> float | None:
+    """Return the value of the first override whose pattern matches a key."""
+    for pattern, value in overrides:
+        if fnmatchcase(key, pattern):
+            return value
+    return None
+
+
+def _write_filters(entry: ConfigEntry):
+    """Return a factory of sensor write filters for the entry's options."""
+    deadbands = split_assignments(entry.options.get(CONF_DEADBANDS, ""))
+    min_intervals = split_assignments(entry.options.get(CONF_MIN_WRITE_INTERVALS, ""))
+    max_interval = entry.options.get(
+        CONF_MAX_WRITE_INTERVAL, DEFAULT_MAX_WRITE_INTERVAL
+    )
+
+    def write_filter(subkey: str, config: dict | None) -> DeadbandFilter | None:
+        """Return the filter of a sensor, or None if it writes every change."""
+        config = config or {}
+        deadband = _override(subkey, deadbands)
+        min_interval = _override(subkey, min_intervals)
+        if deadband is None:
+            deadband = config.get("deadband", 0)
+        elif not deadband and min_interval is None:
+            # A deadband of 0 turns filtering off, including the built-in
+            # minimum interval, unless an interval is configured as well.
+            min_interval = 0
+        if min_interval is None:
+            min_interval = config.get("min_interval", 0)
+        if not deadband and not min_interval:
+            return None
+        return DeadbandFilter(deadband, min_interval, max_interval)
+
+    return write_filter
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -183,56 +272,136 @@ async def async_setup_entry(
     if not coordinator.data:
         return
 
-    sensors = []
+    patterns = {
+        ENDPOINT_KEYS[endpoint]: (split_patterns(include), split_patterns(exclude))
+        for endpoint, (include, exclude) in get_entity_patterns(entry).items()
+    }
+    write_filter = _write_filters(entry)
+    configured = []
+    enabled = []
+    disabled = []
 
     # Process all keys in the JSON and create sensors for them
     # We'll use a flat structure for simplicity
-    for key, value in _flatten_dict(coordinator.data).items():
+    for key, value in coordinator.values.items():
         # Skip non-scalar values
         if not _is_value_scalar(value):
             continue
 
+        root, _, subkey = key.partition(".")
+        include, exclude = patterns.get(root, ((), ()))
+        if _matches(subkey, exclude):
+            continue
+
         # Check if this is a known sensor type
         sensor_config = KNOWN_SENSORS.get(key.split(".")[-1], None)
 
         if sensor_config:
             # Create a configured sensor for known types
-            sensors.append(
+            configured.append(
                 ConfiguredZyxelSensor(
                     coordinator,
                     entry,
                     key,
-                    sensor_config
+                    sensor_config,
+                    write_filter(subkey, sensor_config),
+                )
+            )
+        elif _matches(subkey, include):
+            enabled.append(
+                GenericZyxelSensor(
+                    coordinator, entry, key, write_filter=write_filter(subkey, None)
                 )
             )
         else:
-            # Create a generic sensor for unknown types
-            sensors.append(
+            # Unknown keys are available but must be enabled by the user
+            disabled.append(
                 GenericZyxelSensor(
                     coordinator,
                     entry,
-                    key
+                    key,
+                    enabled_default=False,
+                    write_filter=write_filter(subkey, None),
                 )
             )
 
-    if sensors:
-        async_add_entities(sensors)
+    derived = []
+    for key in coordinator.values:
+        root, _, subkey = key.partition(".")
+        if (
+            root != "traffic"
+            or key.rpartition(".")[2] not in THROUGHPUT_COUNTERS
+            or _matches(subkey, patterns["traffic"][1])
+        ):
+            continue
+        derived.append(ZyxelThroughputSensor(coordinator, entry, key, None))
+        derived.extend(
+            ZyxelThroughputSensor(coordinator, entry, key, window)
+            for window in THROUGHPUT_WINDOWS
+        )
+        derived.extend(
+            ZyxelUsageSensor(coordinator, entry, key, period)
+            for period in USAGE_PERIODS
+        )
+
+    derived.extend(
+        ZyxelBurstSignalSensor(coordinator, entry, signal)
+        for signal in BURST_SIGNALS
+        if f"cellular.{signal}" in coordinator.values
+    )
+
+    derived.append(ZyxelSuppressedWritesSensor(coordinator, entry))
+    derived.append(ZyxelFilteredWritesSensor(coordinator, entry))
+    derived.append(ZyxelReauthSensor(coordinator, entry))
+    derived.append(ZyxelRebootDowntimeSensor(coordinator, entry))
+    derived.extend(
+        ZyxelEndpointLatencySensor(coordinator, entry, endpoint)
+        for endpoint in ENDPOINT_KEYS
+    )
+
+    # The limit covers every sensor. Generic sensors come last, so they are
+    # the first left out, disabled ones before enabled ones.
+    sensors = configured + derived + enabled + disabled
+    max_entities = entry.options.get(CONF_MAX_ENTITIES, DEFAULT_MAX_ENTITIES)
+    if len(sensors) > max_entities:
+        _LOGGER.warning(
+            "Router exposes %d sensors, only the first %d are created. Narrow "
+            "the entity patterns or raise the limit in the integration options",
+            len(sensors),
+            max_entities,
+        )
+        sensors = sensors[:max_entities]
+
+    async_add_entities(sensors)
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device of the router of ``entry``, shared by its sensors."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"Zyxel ({entry.data['host']})",
+        manufacturer="Zyxel",
+        model="",
+    )
 
 
 class AbstractZyxelSensor(CoordinatorEntity, SensorEntity):
     """Base class for Zyxel device sensors."""
 
-    def __init__(self, coordinator, entry: ConfigEntry, key: str):
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        key: str,
+        write_filter: DeadbandFilter | None = None,
+    ):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._key = key
+        self._key_id = coordinator.values.key_id(key)
+        self._filter = write_filter
         self._attr_unique_id = f"{entry.entry_id}_{key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"Zyxel ({entry.data['host']})",
-            manufacturer="Zyxel",
-            model="",
-        )
+        self._attr_device_info = device_info(entry)
 
     @property
     def available(self) -> bool:
@@ -241,27 +410,71 @@ class AbstractZyxelSensor(CoordinatorEntity, SensorEntity):
             return False
 
         # Check if the key exists in the data
-        try:
-            self._get_value_from_path()
-            return True
-        except (KeyError, AttributeError):
-            return False
+        return self.coordinator.values.has_id(self._key_id)
 
-    def _get_value_from_path(self) -> Any:
-        """Get a value from nested dictionaries using the flattened key."""
-        keys = self._key.split(".")
-        value = self.coordinator.data
-        for k in keys:
-            value = value[k]
-        return value
+    async def async_added_to_hass(self) -> None:
+        """Keep the endpoint of this sensor polled while it is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_consumer(self._key.partition(".")[0])
+        )
+        if self._filter is not None:
+            # The state written when the entity is added.
+            self._filter.record(self._get_value(), time.monotonic())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value or availability changed."""
+        coordinator = self.coordinator
+        if self._filter is None:
+            if coordinator.has_changed(self._key):
+                self.async_write_ha_state()
+            else:
+                coordinator.suppressed_writes += 1
+            return
+
+        # Availability may have changed, which is always written.
+        if coordinator.changed_keys is None:
+            self._filter.reset()
+        now = time.monotonic()
+        value = self._get_value()
+        reason = self._filter.check(value, now)
+        if reason is None:
+            if coordinator.has_changed(self._key):
+                coordinator.filtered_writes += 1
+            else:
+                coordinator.suppressed_writes += 1
+            return
+
+        if reason == WRITE_MAX_INTERVAL:
+            coordinator.forced_writes += 1
+        self._filter.record(value, now)
+        self.async_write_ha_state()
+
+    def _get_value(self) -> Any:
+        """Get the value of this sensor from the coordinator's value table."""
+        return self.coordinator.values.get_id(self._key_id)
+
+    def _state_value(self) -> Any:
+        """Return the value to report, the last one let through the filter."""
+        if self._filter is not None and self._filter.has_value:
+            return self._filter.value
+        return self._get_value()
 
 
 class ConfiguredZyxelSensor(AbstractZyxelSensor):
     """Representation of a configured Zyxel sensor."""
 
-    def __init__(self, coordinator, entry: ConfigEntry, key: str, config: dict):
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        key: str,
+        config: dict,
+        write_filter: DeadbandFilter | None = None,
+    ):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, key)
+        super().__init__(coordinator, entry, key, write_filter)
         self._config = config
         self._attr_name = f"Zyxel {config['name']}"
         self._attr_native_unit_of_measurement = config["unit"]
@@ -272,30 +485,380 @@ class ConfiguredZyxelSensor(AbstractZyxelSensor):
     @property
     def state(self):
         """Return the state of the sensor."""
-        try:
-            return self._get_value_from_path()
-        except (KeyError, AttributeError):
-            return None
+        return self._state_value()
 
 
 class GenericZyxelSensor(AbstractZyxelSensor):
     """Representation of a generic Zyxel sensor."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        name_parts = self._key.split(".")
-        return f"Zyxel {'.'.join(name_parts)}"
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        key: str,
+        enabled_default: bool = True,
+        write_filter: DeadbandFilter | None = None,
+    ):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key, write_filter)
+        self._attr_name = f"Zyxel {key}"
+        self._attr_entity_registry_enabled_default = enabled_default
 
     @property
     def state(self):
         """Return the state of the sensor."""
-        try:
-            return self._get_value_from_path()
-        except (KeyError, AttributeError):
-            return None
+        return self._state_value()
 
     @property
     def icon(self):
         """Return the icon."""
         return "mdi:router-wireless"
+
+
+class AbstractZyxelDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors describing the integration itself."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, entry: ConfigEntry, key: str):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = device_info(entry)
+        self._written: Any = None
+
+    def _written_state(self) -> Any:
+        """Return what has to change for a new state to be written."""
+        return self.native_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when it changed."""
+        state = (self.available, self._written_state())
+        if state != self._written:
+            self._written = state
+            self.async_write_ha_state()
+
+
+class ZyxelSuppressedWritesSensor(AbstractZyxelDiagnosticSensor):
+    """Number of sensor state writes skipped because nothing changed."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:database-off-outline"
+    _attr_name = "Zyxel Suppressed State Writes"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "suppressed_writes")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of suppressed writes."""
+        return self.coordinator.suppressed_writes
+
+
+class ZyxelFilteredWritesSensor(AbstractZyxelDiagnosticSensor):
+    """Number of sensor state changes held back by a deadband filter."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:filter-outline"
+    _attr_name = "Zyxel Filtered State Writes"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "filtered_writes")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of filtered writes."""
+        return self.coordinator.filtered_writes
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of writes forced after the maximum interval."""
+        return {"forced_writes": self.coordinator.forced_writes}
+
+    def _written_state(self) -> Any:
+        """Write a new state when either counter changed."""
+        return self.coordinator.filtered_writes, self.coordinator.forced_writes
+
+
+class ZyxelReauthSensor(AbstractZyxelDiagnosticSensor):
+    """Number of times the router session had to be renewed during a poll."""
+
+    _attr_icon = "mdi:account-key"
+    _attr_name = "Zyxel Reauthentications"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "reauths")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of reauthentications."""
+        return self.coordinator.stats.reauths
+
+
+class ZyxelRebootDowntimeSensor(AbstractZyxelDiagnosticSensor):
+    """Time the router took to come back after the last reboot."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_icon = "mdi:restart-alert"
+    _attr_name = "Zyxel Reboot Downtime"
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "reboot_downtime")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the downtime of the last reboot in seconds."""
+        downtime = self.coordinator.reboot_downtime
+        return None if downtime is None else round(downtime)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the router is rebooting."""
+        return {"rebooting": self.coordinator.rebooting}
+
+    def _written_state(self) -> Any:
+        """Write a new state when a reboot starts or ends."""
+        return self.native_value, self.coordinator.rebooting
+
+
+class ZyxelEndpointLatencySensor(AbstractZyxelDiagnosticSensor):
+    """Latency of the last request to a router endpoint."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-outline"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset(
+        {
+            "requests",
+            "failures",
+            "timeouts",
+            "average_latency_ms",
+            "payload_size",
+            "unchanged_payloads",
+            "changed_payloads",
+        }
+    )
+
+    def __init__(self, coordinator, entry: ConfigEntry, endpoint: str):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, f"{endpoint}_latency")
+        self._endpoint = endpoint
+        self._attr_name = f"Zyxel {endpoint} Latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latency of the last request in milliseconds."""
+        latency = self.coordinator.stats.endpoints[self._endpoint].last_latency_ms
+        return None if latency is None else round(latency, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the request counters of the endpoint."""
+        stats = self.coordinator.stats.endpoints[self._endpoint]
+        average = stats.average_latency_ms
+        return {
+            "requests": stats.requests,
+            "failures": stats.failures,
+            "timeouts": stats.timeouts,
+            "average_latency_ms": None if average is None else round(average, 1),
+            "payload_size": stats.payload_size,
+            "unchanged_payloads": stats.unchanged_payloads,
+            "changed_payloads": stats.changed_payloads,
+        }
+
+    def _written_state(self) -> Any:
+        """Write a new state for every request, even at the same latency."""
+        return self.coordinator.stats.endpoints[self._endpoint].requests
+
+
+class ZyxelBurstSignalSensor(AbstractZyxelDiagnosticSensor):
+    """Mean of a cellular signal value over the last burst sampling window.
+
+    Only available while a burst runs, so disabled until needed for alignment.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, entry: ConfigEntry, signal: str):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, f"burst_{signal}")
+        config = KNOWN_SENSORS[signal]
+        self._signal = signal
+        self._attr_name = f"Zyxel {config['name']} Burst"
+        self._attr_icon = config["icon"]
+        self._attr_device_class = config["device_class"]
+        self._attr_native_unit_of_measurement = config["unit"]
+
+    def _summary(self) -> dict[str, Any] | None:
+        """Return the statistics of the signal in the last window."""
+        burst = self.coordinator.burst
+        return None if burst is None else burst.summary.get(self._signal)
+
+    @property
+    def available(self) -> bool:
+        """Return if burst sampling published statistics for the signal."""
+        return super().available and self._summary() is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean of the last window."""
+        summary = self._summary()
+        return None if summary is None else round(summary["mean"], 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the spread of the last window."""
+        summary = self._summary()
+        if summary is None:
+            return None
+        return {
+            "min": summary["min"],
+            "max": summary["max"],
+            "stddev": round(summary["stddev"], 2),
+            "samples": summary["samples"],
+        }
+
+    def _written_state(self) -> Any:
+        """Write a new state for every published window."""
+        burst = self.coordinator.burst
+        return None if burst is None else burst.published
+
+
+class AbstractZyxelCounterSensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors derived from a Traffic_Status byte counter."""
+
+    def __init__(self, coordinator, entry: ConfigEntry, key: str):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._interface = key.split(".")[1]
+        self._direction = "Download" if key.endswith("BytesReceived") else "Upload"
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the traffic counters polled while this sensor is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_consumer("traffic"))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state whenever a new counter sample was taken."""
+        if (
+            self.coordinator.changed_keys is None
+            or "traffic" in self.coordinator.fetched_keys
+        ):
+            self.async_write_ha_state()
+        else:
+            self.coordinator.suppressed_writes += 1
+
+
+class ZyxelThroughputSensor(AbstractZyxelCounterSensor):
+    """Throughput derived from a Traffic_Status byte counter."""
+
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_icon = "mdi:speedometer"
+    _attr_native_unit_of_measurement = UnitOfDataRate.BYTES_PER_SECOND
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_unit_of_measurement = UnitOfDataRate.MEGABITS_PER_SECOND
+
+    def __init__(
+        self, coordinator, entry: ConfigEntry, key: str, window: int | None
+    ):
+        """Initialize the sensor.
+
+        ``window`` is the averaging window in seconds, or None for the rate
+        between the last two samples.
+        """
+        super().__init__(coordinator, entry, key)
+        self._window = window
+
+        interface, direction = self._interface, self._direction
+        if window is None:
+            self._attr_name = f"Zyxel {interface} {direction} Rate"
+            self._attr_unique_id = f"{entry.entry_id}_{key}_rate"
+        else:
+            self._attr_name = (
+                f"Zyxel {interface} {direction} Rate ({window // 60} min average)"
+            )
+            self._attr_unique_id = f"{entry.entry_id}_{key}_rate_{window}"
+            # Only the shortest window is enabled by default.
+            self._attr_entity_registry_enabled_default = (
+                window == THROUGHPUT_WINDOWS[0]
+            )
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            self.coordinator.last_update_success
+            and self._key in self.coordinator.throughput
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the throughput in bytes per second."""
+        counter = self.coordinator.throughput.get(self._key)
+        if counter is None:
+            return None
+        if self._window is None:
+            rate = counter.rate
+        else:
+            rate = counter.window_rate(self._window)
+        return None if rate is None else round(rate, 1)
+
+
+class ZyxelUsageSensor(AbstractZyxelCounterSensor):
+    """Data usage of the current period from a Traffic_Status byte counter."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_icon = "mdi:chart-bar"
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_suggested_unit_of_measurement = UnitOfInformation.GIGABYTES
+
+    def __init__(self, coordinator, entry: ConfigEntry, key: str, period: str):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._period = period
+        self._attr_name = (
+            f"Zyxel {self._interface} {self._direction} "
+            f"{USAGE_PERIOD_NAMES[period]}"
+        )
+        self._attr_unique_id = f"{entry.entry_id}_{key}_usage_{period}"
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            self.coordinator.last_update_success
+            and self._key in self.coordinator.usage
+        )
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the bytes counted in the current period."""
+        meter = self.coordinator.usage.get(self._key)
+        if meter is None:
+            return None
+        return meter.usage(self._period, dt_util.now())
+
+    @property
+    def last_reset(self) -> datetime | None:
+        """Return the start of the current period."""
+        meter = self.coordinator.usage.get(self._key)
+        if meter is None:
+            return None
+        return period_start(self._period, dt_util.now(), meter.billing_day)
@@ -0,0 +1,118 @@
+"""Services of the Zyxel integration."""
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_INTERVAL,
+    ATTR_MAX_SIZE,
+    ATTR_WINDOW,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_BURST_WINDOW,
+    DEFAULT_CAPTURE_SIZE,
+    DOMAIN,
+    MAX_BURST_DURATION,
+    MAX_BURST_INTERVAL,
+    MAX_BURST_WINDOW,
+    MAX_CAPTURE_SIZE,
+    SERVICE_START_BURST,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_BURST,
+    SERVICE_STOP_CAPTURE,
+)
+from .coordinator import ZyxelDataUpdateCoordinator
+from .fleet import async_get_fleet
+
+START_BURST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_BURST_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=MAX_BURST_DURATION)
+        ),
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_BURST_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_BURST_INTERVAL)
+        ),
+        vol.Optional(ATTR_WINDOW, default=DEFAULT_BURST_WINDOW): vol.All(
+            vol.Coerce(int), vol.Range(min=2, max=MAX_BURST_WINDOW)
+        ),
+    }
+)
+
+STOP_BURST_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_MAX_SIZE, default=DEFAULT_CAPTURE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_CAPTURE_SIZE)
+        ),
+    }
+)
+
+STOP_CAPTURE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> ZyxelDataUpdateCoordinator:
+    """Return the coordinator of the config entry targeted by a call."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    if entry_id not in hass.data.get(DOMAIN, {}):
+        raise ServiceValidationError(f"No loaded Zyxel router with entry {entry_id}")
+    return hass.data[DOMAIN][entry_id]["coordinator"]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+    if hass.services.has_service(DOMAIN, SERVICE_START_BURST):
+        return
+
+    async def async_start_burst(call: ServiceCall) -> None:
+        """Switch a router to burst sampling of its cellular signal."""
+        coordinator = _get_coordinator(hass, call)
+        coordinator.async_start_burst(
+            call.data[ATTR_DURATION], call.data[ATTR_INTERVAL], call.data[ATTR_WINDOW]
+        )
+        async_get_fleet(hass).async_poll_soon(call.data[ATTR_CONFIG_ENTRY_ID])
+
+    async def async_stop_burst(call: ServiceCall) -> None:
+        """Return a router to normal polling."""
+        _get_coordinator(hass, call).async_stop_burst()
+
+    async def async_start_capture(call: ServiceCall) -> None:
+        """Record the raw endpoint payloads of a router to a file."""
+        coordinator = _get_coordinator(hass, call)
+        await coordinator.async_start_capture(call.data[ATTR_MAX_SIZE] * 1024 * 1024)
+
+    async def async_stop_capture(call: ServiceCall) -> None:
+        """Stop recording the endpoint payloads of a router."""
+        await _get_coordinator(hass, call).async_stop_capture()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_BURST, async_start_burst, schema=START_BURST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_BURST, async_stop_burst, schema=STOP_BURST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_CAPTURE, async_start_capture, schema=START_CAPTURE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_CAPTURE, async_stop_capture, schema=STOP_CAPTURE_SCHEMA
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services once no router is loaded."""
+    hass.services.async_remove(DOMAIN, SERVICE_START_BURST)
+    hass.services.async_remove(DOMAIN, SERVICE_STOP_BURST)
+    hass.services.async_remove(DOMAIN, SERVICE_START_CAPTURE)
+    hass.services.async_remove(DOMAIN, SERVICE_STOP_CAPTURE)
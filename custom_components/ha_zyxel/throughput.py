@@ -0,0 +1,163 @@
+"""Throughput derived from the cumulative byte counters of a Zyxel device."""
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+
+from .const import MIN_ENDPOINT_INTERVAL
+
+# Counters read above this value are 64-bit and never wrap in practice. A
+# 32-bit counter wraps to zero after its maximum; see counter_delta for how a
+# wrap is told apart from a reset, e.g. after a router reboot.
+_COUNTER_32_MAX = 2**32
+_COUNTER_32_WRAP_FLOOR = 2**31
+
+# Fastest a byte counter can grow, in bytes per second: 2.5 Gbit/s, the
+# fastest port of a Zyxel cellular router. A larger increase is not real.
+MAX_LINK_RATE = 2_500_000_000 // 8
+
+# Seconds the boot times derived from two uptime readings may differ by
+# without the router having restarted, for request latency and uptime
+# resolution.
+BOOT_TIME_TOLERANCE = 60
+
+THROUGHPUT_WINDOWS = (60, 300)
+
+
+def counter_delta(
+    last: int,
+    value: int,
+    elapsed: float | None = None,
+    restarted: bool | None = None,
+) -> int:
+    """Return the increase of a cumulative counter from ``last`` to ``value``.
+
+    ``elapsed`` is the number of seconds between the two readings and
+    ``restarted`` whether the router restarted in between, both None when
+    unknown. A drop is only a wrap of a 32-bit counter when the router is
+    known not to have restarted and the wrapped increase fits MAX_LINK_RATE;
+    any other drop is a reset, and the counter counted ``value`` from zero.
+    An increase above MAX_LINK_RATE is rejected and counts as zero.
+    """
+    delta = value - last
+    if delta < 0:
+        wrapped = delta + _COUNTER_32_MAX
+        if (
+            restarted is False
+            and _COUNTER_32_WRAP_FLOOR <= last < _COUNTER_32_MAX
+            and elapsed is not None
+            and wrapped <= MAX_LINK_RATE * elapsed
+        ):
+            delta = wrapped
+        else:
+            delta = value
+    if elapsed is not None and delta > MAX_LINK_RATE * elapsed:
+        return 0
+    return delta
+
+
+class CounterBaseline:
+    """Last reading of a cumulative counter, the next increase is taken from.
+
+    Keeps the boot time of the router at the last reading, so that a drop
+    of the counter can be told apart as a reset or a wrap.
+    """
+
+    def __init__(self, value: int | None = None, boot: float | None = None) -> None:
+        """Initialize the baseline."""
+        self.value = value
+        # Boot time of the router, as a POSIX timestamp, when last known.
+        self.boot = boot
+
+    def advance(
+        self,
+        value: int,
+        elapsed: float | None,
+        boot: float | None = None,
+        *,
+        restarted: bool = False,
+    ) -> int:
+        """Return the increase up to ``value`` and make it the baseline.
+
+        ``boot`` is the boot time of the router read together with ``value``,
+        if any, and ``restarted`` tells that the router is known to have
+        restarted since the last reading, e.g. after a reboot command.
+        """
+        last = self.value
+        self.value = value
+        if last is None:
+            self.boot = boot
+            return 0
+
+        if restarted:
+            known: bool | None = True
+        elif self.boot is None or boot is None:
+            known = None
+        else:
+            known = boot > self.boot + BOOT_TIME_TOLERANCE
+        delta = counter_delta(last, value, elapsed, known)
+
+        if boot is not None:
+            self.boot = boot
+        elif value < last:
+            # The drop was taken as a reset without knowing the boot time,
+            # which can no longer tell whether the router restarted since.
+            self.boot = None
+        return delta
+
+
+class CounterRate:
+    """Instantaneous and windowed rate of a cumulative counter.
+
+    Counter deltas are summed into a running total that survives wraps and
+    resets, told apart by ``CounterBaseline``. Each window keeps a bounded
+    ring buffer of (time, total) samples holding just enough history to span
+    the window, so adding a sample and reading a rate are both O(1) amortized.
+    """
+
+    def __init__(self, windows: tuple[int, ...] = THROUGHPUT_WINDOWS) -> None:
+        """Initialize the rate tracker."""
+        self._baseline = CounterBaseline()
+        self._last_time: float | None = None
+        self._total = 0
+        self.rate: float | None = None
+        self._samples: dict[int, deque[tuple[float, int]]] = {
+            window: deque(maxlen=ceil(window / MIN_ENDPOINT_INTERVAL) + 2)
+            for window in windows
+        }
+
+    def add(
+        self,
+        value: int,
+        now: float,
+        boot: float | None = None,
+        *,
+        restarted: bool = False,
+    ) -> None:
+        """Add a counter reading taken at monotonic time ``now``.
+
+        ``boot`` and ``restarted`` are passed on to ``CounterBaseline``.
+        """
+        if self._last_time is not None and now <= self._last_time:
+            return
+        elapsed = None if self._last_time is None else now - self._last_time
+        delta = self._baseline.advance(value, elapsed, boot, restarted=restarted)
+        if elapsed is not None:
+            self._total += delta
+            self.rate = delta / elapsed
+        self._last_time = now
+
+        for window, samples in self._samples.items():
+            samples.append((now, self._total))
+            # Keep a single sample at or before the start of the window.
+            while len(samples) > 2 and samples[1][0] <= now - window:
+                samples.popleft()
+
+    def window_rate(self, window: int) -> float | None:
+        """Return the average rate over the last ``window`` seconds."""
+        samples = self._samples[window]
+        if len(samples) < 2:
+            return None
+        start_time, start_total = samples[0]
+        end_time, end_total = samples[-1]
+        return (end_total - start_total) / (end_time - start_time)
@@ -0,0 +1,117 @@
+"""Data usage accounting from the byte counters of a Zyxel device."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from .throughput import CounterBaseline
+
+# Periods usage is accounted over. The billing cycle starts on a configured
+# day of the month.
+USAGE_DAY = "day"
+USAGE_MONTH = "month"
+USAGE_CYCLE = "cycle"
+USAGE_PERIODS = (USAGE_DAY, USAGE_MONTH, USAGE_CYCLE)
+
+
+def period_start(period: str, now: datetime, billing_day: int) -> datetime:
+    """Return the start of the ``period`` containing the local time ``now``."""
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == USAGE_DAY:
+        return start
+    if period == USAGE_MONTH:
+        return start.replace(day=1)
+    if now.day >= billing_day:
+        return start.replace(day=billing_day)
+    if start.month == 1:
+        return start.replace(year=start.year - 1, month=12, day=billing_day)
+    return start.replace(month=start.month - 1, day=billing_day)
+
+
+class UsageMeter:
+    """Usage of a cumulative byte counter per period, across counter resets.
+
+    Every reading adds its increase over the previous one to the total and
+    to the usage of the current day, month and billing cycle. A period that
+    has ended starts again from zero on the next reading, so the usage is
+    kept up to date without looking back at earlier readings.
+
+    The last reading is persisted with the time it was taken and the boot
+    time of the router, so that a reading after a restart of Home Assistant
+    does not take a reset of the router for a counter wrap.
+    """
+
+    def __init__(self, billing_day: int) -> None:
+        """Initialize the meter."""
+        self.billing_day = billing_day
+        self.baseline = CounterBaseline()
+        self.last_time: datetime | None = None
+        self.total = 0
+        # Start and usage of the current period, by period.
+        self.periods: dict[str, tuple[datetime, int]] = {}
+
+    def add(
+        self,
+        value: int,
+        now: datetime,
+        boot: float | None = None,
+        *,
+        restarted: bool = False,
+    ) -> None:
+        """Add a counter reading taken at the local time ``now``.
+
+        ``boot`` and ``restarted`` are passed on to ``CounterBaseline``.
+        """
+        elapsed = (
+            None
+            if self.last_time is None
+            else (now - self.last_time).total_seconds()
+        )
+        delta = self.baseline.advance(value, elapsed, boot, restarted=restarted)
+        self.last_time = now
+        self.total += delta
+        for period in USAGE_PERIODS:
+            start = period_start(period, now, self.billing_day)
+            current = self.periods.get(period)
+            if current is None or current[0] != start:
+                self.periods[period] = (start, delta)
+            else:
+                self.periods[period] = (start, current[1] + delta)
+
+    def usage(self, period: str, now: datetime) -> int:
+        """Return the bytes counted in the ``period`` containing ``now``."""
+        current = self.periods.get(period)
+        if current is None or current[0] != period_start(
+            period, now, self.billing_day
+        ):
+            return 0
+        return current[1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the meter state as JSON-safe data."""
+        return {
+            "last_value": self.baseline.value,
+            "last_boot": self.baseline.boot,
+            "last_time": None if self.last_time is None else self.last_time.isoformat(),
+            "total": self.total,
+            "periods": {
+                period: [start.isoformat(), usage]
+                for period, (start, usage) in self.periods.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], billing_day: int) -> UsageMeter:
+        """Return a meter restored from ``as_dict`` data."""
+        meter = cls(billing_day)
+        # Totals stored before the time and boot time of the last reading were
+        # kept lack them; a drop after restoring such a meter is a reset.
+        meter.baseline = CounterBaseline(data["last_value"], data.get("last_boot"))
+        if data.get("last_time") is not None:
+            meter.last_time = datetime.fromisoformat(data["last_time"])
+        meter.total = data["total"]
+        meter.periods = {
+            period: (datetime.fromisoformat(start), usage)
+            for period, (start, usage) in data["periods"].items()
+        }
+        return meter
@@ -0,0 +1,266 @@
+"""Compact table of the flattened values of a Zyxel snapshot."""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+_MISSING = object()
+
+
+class _SchemaNode:
+    """Dotted key of a payload path, its slot and the nodes below it."""
+
+    __slots__ = ("children", "key", "key_id")
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.key_id: int | None = None
+        # Only nodes of nested dictionaries have children.
+        self.children: dict[str, _SchemaNode] | None = None
+
+
+class TableSchema:
+    """Key IDs and payload paths, shared by the value tables using them.
+
+    Routers on the same firmware report the same keys, so the key strings,
+    their IDs and the schema tree are kept once for all of them, and each
+    table only holds its slots. IDs are never reused, so the schema only
+    grows with keys none of its routers reported before, until the last
+    table using it is dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty schema."""
+        self.ids: dict[str, int] = {}
+        self.keys: list[str] = []
+        self.roots: dict[str, _SchemaNode] = {}
+        # IDs of the leaves below each endpoint key.
+        self.root_ids: dict[str, list[int]] = {}
+
+    def key_id(self, key: str) -> int:
+        """Return the ID of ``key``, compiling it on first use."""
+        key_id = self.ids.get(key)
+        if key_id is None:
+            key_id = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+        return key_id
+
+    def root(self, root: str) -> _SchemaNode:
+        """Return the schema node of endpoint key ``root``."""
+        node = self.roots.get(root)
+        if node is None:
+            node = self.roots[root] = _SchemaNode(root)
+            self.root_ids[root] = []
+        return node
+
+    def leaf_id(self, root: str, node: _SchemaNode) -> int:
+        """Return the ID of leaf ``node`` below ``root``."""
+        key_id = node.key_id
+        if key_id is None:
+            key_id = node.key_id = self.key_id(node.key)
+            self.root_ids[root].append(key_id)
+        return key_id
+
+
+class SchemaRegistry:
+    """Table schemas by key, kept while at least one table uses them."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._schemas: dict[str, TableSchema] = {}
+        self._users: dict[str, int] = {}
+
+    def acquire(self, key: str) -> TableSchema:
+        """Return the schema of ``key``, creating it for its first user."""
+        schema = self._schemas.get(key)
+        if schema is None:
+            schema = self._schemas[key] = TableSchema()
+        self._users[key] = self._users.get(key, 0) + 1
+        return schema
+
+    def release(self, key: str) -> None:
+        """Drop a user of the schema of ``key``, and the schema with its last."""
+        users = self._users.get(key, 0) - 1
+        if users > 0:
+            self._users[key] = users
+        else:
+            self._users.pop(key, None)
+            self._schemas.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+class ValueTable(Mapping[str, Any]):
+    """Flattened snapshot values, stored in slots indexed by key IDs.
+
+    Reads like a dict of dotted keys such as ``cellular.INTF_RSSI``. Each
+    key is compiled once into an ID, the index of its slot, and a schema
+    tree mirrors the payload of every endpoint so that an update writes each
+    value into its slot in place, without building key strings or new
+    dictionaries. IDs are never reused, so entities can resolve theirs once.
+    """
+
+    def __init__(self, schema: TableSchema | None = None) -> None:
+        """Initialize an empty table, with its own schema unless given one."""
+        self._schema = TableSchema() if schema is None else schema
+        self._slots: list[Any] = []
+        # Update generation in which each slot was last written.
+        self._seen: list[int] = []
+        self._generation = 0
+
+    def _grow(self) -> None:
+        """Give every key of the schema a slot in this table."""
+        missing = len(self._schema.keys) - len(self._slots)
+        if missing > 0:
+            self._slots.extend([_MISSING] * missing)
+            self._seen.extend([0] * missing)
+
+    def key_id(self, key: str) -> int:
+        """Return the ID of ``key``, compiling it on first use."""
+        key_id = self._schema.key_id(key)
+        if key_id >= len(self._slots):
+            self._grow()
+        return key_id
+
+    def has_id(self, key_id: int) -> bool:
+        """Return whether the key with ID ``key_id`` has a value."""
+        return self._slots[key_id] is not _MISSING
+
+    def get_id(self, key_id: int, default: Any = None) -> Any:
+        """Return the value of the key with ID ``key_id``."""
+        value = self._slots[key_id]
+        return default if value is _MISSING else value
+
+    def roots(self) -> list[str]:
+        """Return the endpoint keys that have values."""
+        return [
+            root
+            for root, key_ids in self._schema.root_ids.items()
+            if any(self._value(key_id) is not _MISSING for key_id in key_ids)
+        ]
+
+    def update(self, root: str, tree: Any) -> set[str]:
+        """Write the payload of endpoint key ``root`` and return changed keys.
+
+        Keys of ``root`` that are no longer in the payload lose their value.
+        """
+        self._generation += 1
+        node = self._schema.root(root)
+        changed: set[str] = set()
+        if isinstance(tree, dict):
+            self._write_tree(root, node, tree, changed)
+        else:
+            self._write_leaf(root, node, tree, changed)
+        self._clear(root, changed, self._generation)
+        return changed
+
+    def remove(self, root: str) -> set[str]:
+        """Clear every value of endpoint key ``root`` and return their keys."""
+        changed: set[str] = set()
+        if root in self._schema.root_ids:
+            self._clear(root, changed, self._generation + 1)
+        return changed
+
+    def subtree_items(self, root: str) -> Iterator[tuple[str, Any]]:
+        """Yield the keys and values below endpoint key ``root``."""
+        keys = self._schema.keys
+        for key_id in self._schema.root_ids.get(root, ()):
+            value = self._value(key_id)
+            if value is not _MISSING:
+                yield keys[key_id], value
+
+    def as_tree(self) -> dict[str, Any]:
+        """Return the values as nested dictionaries, shaped like the payloads."""
+        tree = {}
+        for root, node in self._schema.roots.items():
+            value = self._node_value(node)
+            if value is not _MISSING:
+                tree[root] = value
+        return tree
+
+    def _node_value(self, node: _SchemaNode) -> Any:
+        if node.key_id is not None:
+            value = self._value(node.key_id)
+            if value is not _MISSING:
+                return value
+        if not node.children:
+            return _MISSING
+        subtree = {}
+        for name, child in node.children.items():
+            value = self._node_value(child)
+            if value is not _MISSING:
+                subtree[name] = value
+        return subtree or _MISSING
+
+    def _value(self, key_id: int) -> Any:
+        """Return the slot of ``key_id``, which may not exist in this table yet."""
+        return self._slots[key_id] if key_id < len(self._slots) else _MISSING
+
+    def _write_tree(
+        self, root: str, node: _SchemaNode, tree: dict, changed: set[str]
+    ) -> None:
+        children = node.children
+        if children is None:
+            children = node.children = {}
+        for name, value in tree.items():
+            child = children.get(name)
+            if child is None:
+                child = children[name] = _SchemaNode(f"{node.key}.{name}")
+            if isinstance(value, dict):
+                self._write_tree(root, child, value, changed)
+            else:
+                self._write_leaf(root, child, value, changed)
+
+    def _write_leaf(
+        self, root: str, node: _SchemaNode, value: Any, changed: set[str]
+    ) -> None:
+        key_id = node.key_id
+        if key_id is None:
+            key_id = self._schema.leaf_id(root, node)
+        if key_id >= len(self._slots):
+            self._grow()
+        self._seen[key_id] = self._generation
+        old = self._slots[key_id]
+        if old is _MISSING or old != value:
+            self._slots[key_id] = value
+            changed.add(node.key)
+
+    def _clear(self, root: str, changed: set[str], generation: int) -> None:
+        """Clear the values of ``root`` not written in ``generation``."""
+        self._grow()
+        slots, seen, keys = self._slots, self._seen, self._schema.keys
+        for key_id in self._schema.root_ids[root]:
+            if seen[key_id] != generation and slots[key_id] is not _MISSING:
+                slots[key_id] = _MISSING
+                changed.add(keys[key_id])
+
+    def __getitem__(self, key: str) -> Any:
+        key_id = self._schema.ids.get(key)
+        value = _MISSING if key_id is None else self._value(key_id)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        key_id = self._schema.ids.get(key)  # type: ignore[call-overload]
+        return key_id is not None and self._value(key_id) is not _MISSING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        key_id = self._schema.ids.get(key)
+        value = _MISSING if key_id is None else self._value(key_id)
+        return default if value is _MISSING else value
+
+    def __iter__(self) -> Iterator[str]:
+        slots = self._slots
+        return (
+            self._schema.keys[key_id]
+            for key_id, value in enumerate(slots)
+            if value is not _MISSING
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._slots if value is not _MISSING)
+
+    def __bool__(self) -> bool:
+        return any(value is not _MISSING for value in self._slots)
@@ -0,0 +1,42 @@
+"""Tests for the throughput derived from Zyxel traffic counters."""
+import pytest
+
+from custom_components.ha_zyxel.throughput import CounterRate
+
+BOOT = 1_700_000_000.0
+GIB = 2**30
+
+
+def test_rate_of_increases() -> None:
+    """The rate is the increase per second, also over a window."""
+    rate = CounterRate()
+    rate.add(0, 0.0, BOOT)
+    rate.add(10_000, 10.0, BOOT)
+    rate.add(30_000, 20.0, BOOT)
+    assert rate.rate == 2000
+    assert rate.window_rate(60) == 1500
+
+
+def test_reset_is_not_a_spike() -> None:
+    """A drop after the router restarted counts the new value only."""
+    rate = CounterRate()
+    rate.add(3 * GIB, 0.0, BOOT)
+    rate.add(50_000, 10.0, BOOT + 3600)
+    assert rate.rate == 5000
+
+
+def test_reset_without_uptime_is_not_a_spike() -> None:
+    """A drop without an uptime read in the same update is a reset."""
+    rate = CounterRate()
+    rate.add(3 * GIB, 0.0, BOOT)
+    rate.add(50_000, 10.0)
+    assert rate.rate == 5000
+
+
+def test_wrap_of_32_bit_counter() -> None:
+    """A drop from the wrap range without a restart is a 32-bit wrap."""
+    rate = CounterRate()
+    rate.add(2**32 - 40_000, 0.0, BOOT)
+    rate.add(10_000, 10.0, BOOT)
+    assert rate.rate == 5000
+    assert rate.window_rate(60) == pytest.approx(5000)
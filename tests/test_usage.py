@@ -0,0 +1,79 @@
+"""Tests for the data usage accounting of the Zyxel integration."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.ha_zyxel.usage import USAGE_DAY, UsageMeter
+
+START = datetime(2024, 5, 10, 12, 0, tzinfo=timezone.utc)
+BOOT = START.timestamp() - 86400
+GIB = 2**30
+
+
+def test_usage_counts_increases() -> None:
+    """Each reading adds its increase over the previous one."""
+    meter = UsageMeter(1)
+    meter.add(1000, START, BOOT)
+    meter.add(5000, START + timedelta(seconds=10), BOOT)
+    assert meter.total == 4000
+    assert meter.usage(USAGE_DAY, START) == 4000
+
+
+def test_reset_after_router_reboot() -> None:
+    """A drop from the wrap range after a reboot only counts the new value."""
+    meter = UsageMeter(1)
+    meter.add(3 * GIB, START, BOOT)
+    # The uptime shows that the router restarted a minute ago.
+    later = START + timedelta(minutes=5)
+    meter.add(1000, later, later.timestamp() - 60)
+    assert meter.total == 1000
+
+
+def test_reset_without_uptime() -> None:
+    """A drop is a reset when the uptime does not prove there was no restart."""
+    meter = UsageMeter(1)
+    meter.add(3 * GIB, START, BOOT)
+    meter.add(1000, START + timedelta(seconds=10))
+    assert meter.total == 1000
+
+
+def test_reset_after_reboot_command() -> None:
+    """A drop after a reboot command is a reset, even with a stale uptime."""
+    meter = UsageMeter(1)
+    meter.add(3 * GIB, START, BOOT)
+    meter.add(1000, START + timedelta(seconds=10), BOOT, restarted=True)
+    assert meter.total == 1000
+
+
+def test_reset_after_restore() -> None:
+    """A meter restored from storage does not take a reset for a wrap."""
+    meter = UsageMeter(1)
+    meter.add(3 * GIB, START, BOOT)
+    restored = UsageMeter.from_dict(meter.as_dict(), 1)
+
+    # Home Assistant was down for a day, during which the router rebooted.
+    later = START + timedelta(days=1)
+    restored.add(1000, later, later.timestamp() - 3600)
+    assert restored.total == 1000
+
+
+def test_wrap_of_32_bit_counter() -> None:
+    """A drop from the wrap range without a restart is a 32-bit wrap."""
+    meter = UsageMeter(1)
+    meter.add(2**32 - 1000, START, BOOT)
+    meter.add(500, START + timedelta(seconds=10), BOOT + 1)
+    assert meter.total == 1500
+
+
+def test_wrap_faster_than_link_rate_is_reset() -> None:
+    """A wrap that would mean more traffic than any link carries is a reset."""
+    meter = UsageMeter(1)
+    meter.add(2**31 + 1000, START, BOOT)
+    meter.add(500, START + timedelta(seconds=1), BOOT)
+    assert meter.total == 500
+
+
+def test_increase_faster_than_link_rate_is_rejected() -> None:
+    """An increase no link can carry in the elapsed time is not counted."""
+    meter = UsageMeter(1)
+    meter.add(1000, START, BOOT)
+    meter.add(1000 + 10 * GIB, START + timedelta(seconds=10), BOOT)
+    assert meter.total == 0
@@ -0,0 +1,29 @@
+"""Tests for the value tables of Zyxel snapshots and their schemas."""
+from custom_components.ha_zyxel.value_table import SchemaRegistry, ValueTable
+
+
+def test_tables_share_schema_of_key() -> None:
+    """Tables of the same key share key IDs, each with its own values."""
+    registry = SchemaRegistry()
+    first = ValueTable(registry.acquire("firmware:V1"))
+    second = ValueTable(registry.acquire("firmware:V1"))
+    first.update("cellular", {"INTF_RSSI": -60})
+    second.update("cellular", {"INTF_RSSI": -70})
+    assert first.key_id("cellular.INTF_RSSI") == second.key_id("cellular.INTF_RSSI")
+    assert (first["cellular.INTF_RSSI"], second["cellular.INTF_RSSI"]) == (-60, -70)
+    assert len(registry) == 1
+
+
+def test_schema_dropped_with_last_user() -> None:
+    """A schema is kept until the last table using it is released."""
+    registry = SchemaRegistry()
+    schema = registry.acquire("firmware:V1")
+    registry.acquire("firmware:V1")
+    registry.acquire("entry")
+    registry.release("firmware:V1")
+    assert registry.acquire("firmware:V1") is schema
+    registry.release("firmware:V1")
+    registry.release("firmware:V1")
+    registry.release("entry")
+    assert len(registry) == 0
+    assert registry.acquire("firmware:V1") is not schema